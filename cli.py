@@ -0,0 +1,192 @@
+import time
+
+start_time = time.perf_counter()
+
+import argparse
+import json
+
+from oe.data import MUTATION, CROSS, SELECTIONS, BOUNDARIES, EVALUATORS, FUNCTIONS, REPLACEMENTS, RunContext
+from oe.model.population import Population
+from oe.model.stopping import StoppingCriteria
+from oe.utils.generator import Generator
+from oe.utils.observers import CsvSink, EvaluationsToTarget, History, NdjsonSink
+
+DEFAULTS = {'function': 'GOLDSTEIN_PRICE',
+            'begin_range': None,
+            'end_range': None,
+            'dimensions': None,
+            'population_amount': 100,
+            'epochs': 70,
+            'selection_method': 'BEST',
+            'cross_method': 'ARITHMETIC',
+            'mutation_method': 'UNIFORM',
+            'boundary_method': 'RESAMPLE',
+            'selection_percent': 50,
+            'tournament_size': None,
+            'cross_probability': 0.5,
+            'mutation_probability': 0.2,
+            'maximalization': False,
+            'steady_state': False,
+            'offspring_amount': 2,
+            'replacement_method': 'WORST',
+            'evaluator': None,
+            'max_in_flight': 8,
+            'latency': 0.0,
+            'seed': None}
+STOPPING = ['patience', 'target', 'tolerance', 'min_std', 'min_diversity', 'time_budget', 'evaluations_budget']
+
+
+def positive_int(value):
+    value = int(value)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+    return value
+
+
+def parse_arguments(arguments=None):
+    parser = argparse.ArgumentParser(description='Run the genetic algorithm without the GUI.')
+    parser.add_argument('--config', help='JSON file with the run parameters, overridden by flags')
+    parser.add_argument('--function', choices=list(FUNCTIONS),
+                        help='benchmark function, its bounds are used unless --begin/--end are given')
+    parser.add_argument('--dimensions', type=int)
+    parser.add_argument('--epsilon', type=float, default=1e-4,
+                        help='distance from the known optimum counted as reaching it')
+    parser.add_argument('--begin', dest='begin_range', type=float)
+    parser.add_argument('--end', dest='end_range', type=float)
+    parser.add_argument('--population', dest='population_amount', type=int)
+    parser.add_argument('--epochs', type=int)
+    parser.add_argument('--selection', dest='selection_method', choices=SELECTIONS)
+    parser.add_argument('--cross', dest='cross_method', choices=CROSS)
+    parser.add_argument('--mutation', dest='mutation_method', choices=MUTATION)
+    parser.add_argument('--boundary', dest='boundary_method', choices=BOUNDARIES)
+    parser.add_argument('--selection-percent', dest='selection_percent', type=int)
+    parser.add_argument('--tournament-size', dest='tournament_size', type=int,
+                        help='contestants per tournament, derived from --selection-percent by default')
+    parser.add_argument('--cross-probability', dest='cross_probability', type=float)
+    parser.add_argument('--mutation-probability', dest='mutation_probability', type=float)
+    parser.add_argument('--maximalization', action='store_const', const=True)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--steady-state', dest='steady_state', action='store_const', const=True,
+                        help='replace individuals one offspring batch at a time instead of whole generations')
+    parser.add_argument('--offspring', dest='offspring_amount', type=positive_int, help='offspring per steady-state step')
+    parser.add_argument('--replacement', dest='replacement_method', choices=REPLACEMENTS,
+                        help='individual replaced by a steady-state offspring')
+    parser.add_argument('--evaluator', choices=EVALUATORS,
+                        help='evaluate individuals concurrently, a steady-state run does not wait for stragglers')
+    parser.add_argument('--in-flight', dest='max_in_flight', type=positive_int, help='maximum concurrent evaluations')
+    parser.add_argument('--latency', type=float, help='artificial latency of every evaluation in seconds')
+    parser.add_argument('--patience', type=int, help='stop after this many epochs without improvement')
+    parser.add_argument('--target', type=float, help='stop when the best result reaches this value')
+    parser.add_argument('--tolerance', type=float, help='allowed distance from --target')
+    parser.add_argument('--min-std', dest='min_std', type=float, help='stop when the fitness std drops below')
+    parser.add_argument('--min-diversity', dest='min_diversity', type=float,
+                        help='stop when the mean gene std drops below')
+    parser.add_argument('--time-budget', dest='time_budget', type=float, help='wall-clock budget in seconds')
+    parser.add_argument('--evaluations-budget', dest='evaluations_budget', type=int,
+                        help='budget of objective evaluations')
+    parser.add_argument('--csv', help='stream per-epoch statistics to a CSV file')
+    parser.add_argument('--ndjson', help='stream per-epoch statistics to an NDJSON file')
+    parser.add_argument('--plots', action='store_true', help='save the result charts and results.txt')
+    parser.add_argument('--gui', action='store_true', help='open the GUI instead of running headless')
+    parser.add_argument('--timing', action='store_true', help='report start-up and run time')
+    parsed = parser.parse_args(arguments)
+    parameters = dict(DEFAULTS)
+    if parsed.config:
+        with open(parsed.config) as file:
+            parameters.update(json.load(file))
+    parameters.update({key: value for key, value in vars(parsed).items()
+                       if (key in DEFAULTS or key in STOPPING) and value is not None})
+    benchmark = FUNCTIONS[parameters['function']]
+    if not benchmark.scalable and parameters['dimensions'] not in (None, benchmark.dimensions):
+        parser.error(f"{parameters['function']} is only defined for {benchmark.dimensions} dimensions")
+    for key in ('offspring_amount', 'max_in_flight'):
+        if parameters[key] < 1:
+            parser.error(f'{key} must be a positive integer')
+    return parsed, parameters
+
+
+def run(parameters, observers=()):
+    benchmark = FUNCTIONS[parameters['function']]
+    begin_range = benchmark.begin_range if parameters['begin_range'] is None else parameters['begin_range']
+    end_range = benchmark.end_range if parameters['end_range'] is None else parameters['end_range']
+    dimensions = benchmark.dimensions if parameters['dimensions'] is None else parameters['dimensions']
+    evaluator = None
+    if parameters['evaluator'] is not None:
+        from oe.utils.evaluators import AsyncEvaluator, StandInEvaluator
+        stand_in = StandInEvaluator(benchmark.function, parameters['latency'])
+        evaluator = AsyncEvaluator(stand_in.coroutine if parameters['evaluator'] == 'ASYNCIO' else stand_in,
+                                   parameters['evaluator'], parameters['max_in_flight'])
+    context = RunContext(begin_range=begin_range,
+                         end_range=end_range,
+                         population_amount=parameters['population_amount'],
+                         function=benchmark.function,
+                         seed=parameters['seed'],
+                         evaluator=evaluator)
+    population_generator = Generator(parameters['population_amount'], begin_range, end_range, context)
+    population_class, steady_state = Population, {}
+    if parameters['steady_state']:
+        from oe.model.steady_state_population import SteadyStatePopulation
+        population_class = SteadyStatePopulation
+        steady_state = {'offspring_amount': parameters['offspring_amount'],
+                        'replacement_method': parameters['replacement_method']}
+    population = population_class(
+        population_generator.get_genes(dimensions),
+        mutation_method=parameters['mutation_method'],
+        cross_method=parameters['cross_method'],
+        selection_method=parameters['selection_method'],
+        cross_probability=parameters['cross_probability'],
+        mutation_probability=parameters['mutation_probability'],
+        selection_percent=parameters['selection_percent'],
+        tournament_size=parameters['tournament_size'],
+        maximalization=parameters['maximalization'],
+        boundary_method=parameters['boundary_method'],
+        context=context,
+        **steady_state)
+    for observer in observers:
+        population.add_observer(observer)
+    stopping = {key: parameters[key] for key in STOPPING if parameters.get(key) is not None}
+    stopping_criteria = StoppingCriteria(maximalization=parameters['maximalization'], **stopping) if stopping else None
+    try:
+        population.evolve(parameters['epochs'], stopping_criteria)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+    return population
+
+
+def main(arguments=None):
+    parsed, parameters = parse_arguments(arguments)
+    if parsed.gui:
+        from oe.main import main as gui_main
+        return gui_main()
+    startup_time = time.perf_counter() - start_time
+    sinks = []
+    if parsed.csv:
+        sinks.append(CsvSink(parsed.csv))
+    if parsed.ndjson:
+        sinks.append(NdjsonSink(parsed.ndjson))
+    history = History()
+    evaluations_to_target = EvaluationsToTarget(FUNCTIONS[parameters['function']].optimum, parsed.epsilon)
+    run_start = time.perf_counter()
+    try:
+        population = run(parameters, sinks + [evaluations_to_target] + ([history] if parsed.plots else []))
+    finally:
+        for sink in sinks:
+            sink.close()
+    run_time = time.perf_counter() - run_start
+    print(f'Result: {population.best}')
+    print(f'Stopped after {population.epoch_number} epochs: {population.stop_reason}')
+    print(f'Evaluations to target: {evaluations_to_target.evaluations}')
+    if parsed.timing:
+        print(f'Start-up time: {startup_time:.4f} s, execute time: {run_time:.4f} s')
+    if parsed.plots:
+        import matplotlib
+        matplotlib.use('Agg')
+        from oe.utils.plots import Plots
+        Plots.best_plot(history['best'])
+        Plots.average_plot(history['mean'])
+        Plots.std_plot(history['std'])
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,14 @@
-SELECTIONS = ["BEST", "ROULETTE", "TOURNAMENT"]
+import numpy as np
+
+SELECTIONS = ["BEST", "ROULETTE", "SUS", "TOURNAMENT"]
 CROSS = ["ARITHMETIC", "BLEND_ALPHA", "BLEND_ALPHA_BETA", "LINEAR", "AVERAGE"]
 MUTATION = ["UNIFORM", "GAUSS"]
+BINARY_CROSS = ["ONE_POINT", "TWO_POINT", "UNIFORM"]
+BINARY_MUTATION = ["ONE_POINT_MUTATION", "TWO_POINT_MUTATION", "BIT_FLIP"]
+BOUNDARIES = ["RESAMPLE", "CLIP", "REFLECT", "WRAP", "TRUNCATED"]
+TOPOLOGIES = ["RING", "FULL"]
+REPLACEMENTS = ["WORST", "TOURNAMENT"]
+EVALUATORS = ["ASYNCIO", "THREAD", "PROCESS"]
 
 
 def goldstein_prize(x1, x2):
@@ -9,6 +17,89 @@ def goldstein_prize(x1, x2):
     return part1 * part2
 
 
+def matrix_function(function):
+    function.takes_matrix = True
+    return function
+
+
+def himmelblau(x1, x2):
+    return (x1 * x1 + x2 - 11) ** 2 + (x1 + x2 * x2 - 7) ** 2
+
+
+@matrix_function
+def rastrigin(genes):
+    return 10 * genes.shape[1] + np.sum(genes * genes - 10 * np.cos(2 * np.pi * genes), axis=1)
+
+
+@matrix_function
+def rosenbrock(genes):
+    return np.sum(100 * (genes[:, 1:] - genes[:, :-1] ** 2) ** 2 + (1 - genes[:, :-1]) ** 2, axis=1)
+
+
+@matrix_function
+def ackley(genes):
+    return (-20 * np.exp(-0.2 * np.sqrt(np.mean(genes * genes, axis=1)))
+            - np.exp(np.mean(np.cos(2 * np.pi * genes), axis=1)) + 20 + np.e)
+
+
+@matrix_function
+def schwefel(genes):
+    return 418.9828872724338 * genes.shape[1] - np.sum(genes * np.sin(np.sqrt(np.abs(genes))), axis=1)
+
+
+@matrix_function
+def griewank(genes):
+    indexes = np.sqrt(np.arange(1, genes.shape[1] + 1))
+    return 1 + np.sum(genes * genes, axis=1) / 4000 - np.prod(np.cos(genes / indexes), axis=1)
+
+
+class Benchmark:
+    def __init__(self, function, begin_range, end_range, optimum, dimensions=2, scalable=True):
+        self.function = function
+        self.begin_range = begin_range
+        self.end_range = end_range
+        self.optimum = optimum
+        self.dimensions = dimensions
+        self.scalable = scalable
+
+
+FUNCTIONS = {'GOLDSTEIN_PRICE': Benchmark(goldstein_prize, -2, 2, 3, scalable=False),
+             'HIMMELBLAU': Benchmark(himmelblau, -5, 5, 0, scalable=False),
+             'RASTRIGIN': Benchmark(rastrigin, -5.12, 5.12, 0),
+             'ROSENBROCK': Benchmark(rosenbrock, -5, 10, 0),
+             'ACKLEY': Benchmark(ackley, -32.768, 32.768, 0),
+             'SCHWEFEL': Benchmark(schwefel, -500, 500, 0),
+             'GRIEWANK': Benchmark(griewank, -600, 600, 0)}
+
+
+class BatchFunction:
+    def __init__(self, function):
+        self.function = function
+        self.takes_matrix = getattr(function, 'takes_matrix', False)
+        self.vectorized = None
+        self.evaluations = 0
+        self.calls = 0
+
+    def __call__(self, genes):
+        genes = np.atleast_2d(np.asarray(genes, dtype=float))
+        self.calls += 1
+        self.evaluations += len(genes)
+        if self.takes_matrix:
+            return np.asarray(self.function(genes), dtype=float).reshape(len(genes))
+        if self.vectorized is not False:
+            try:
+                values = np.asarray(self.function(*genes.T), dtype=float)
+            except (TypeError, ValueError):
+                if self.vectorized:
+                    raise
+                values = None
+            if values is not None and values.shape == (len(genes),):
+                self.vectorized = True
+                return values
+            self.vectorized = False
+        return np.fromiter((self.function(*row) for row in genes), dtype=float, count=len(genes))
+
+
 class Singleton:
     def __init__(self, cls):
         self.cls = cls
@@ -23,10 +114,18 @@ class Singleton:
         self.obj = self.cls(**kwargs)
 
 
-@Singleton
-class GlobalData:
-    def __init__(self, begin_range, end_range, population_amount, function=goldstein_prize):
-        self.begin_range = begin_range
-        self.end_range = end_range
+class RunContext:
+    def __init__(self, begin_range, end_range, population_amount, function=goldstein_prize, seed=None,
+                 evaluator=None):
+        self.begin_range = begin_range if np.isscalar(begin_range) else np.asarray(begin_range, dtype=float)
+        self.end_range = end_range if np.isscalar(end_range) else np.asarray(end_range, dtype=float)
         self.function = function
+        self.evaluate = BatchFunction(function) if evaluator is None else evaluator
         self.population_amount = population_amount
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+GlobalData = Singleton(RunContext)
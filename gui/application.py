@@ -1,15 +1,22 @@
+import queue
+import threading
 import tkinter as tk
-import numpy as np
 import time
 from tkinter import ttk
 
-from oe.data import MUTATION, CROSS, SELECTIONS, goldstein_prize, GlobalData
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from oe.data import MUTATION, CROSS, SELECTIONS, BOUNDARIES, FUNCTIONS, RunContext
 from oe.gui.placeholder import Placeholder
 from oe.utils.plots import Plots
-from oe.utils.bin_converter import Converter
 from oe.utils.generator import Generator
+from oe.utils.observers import EvaluationsToTarget, History
 from oe.model.population import Population
 
+POLL_INTERVAL = 50
+REFRESH_INTERVAL = 0.5
+
 
 class Application(tk.Frame):
 
@@ -17,6 +24,9 @@ class Application(tk.Frame):
         super().__init__(master)
         self.master = master
         self.master.title("Genetic Algorithm")
+        self.worker = None
+        self.cancel_event = threading.Event()
+        self.progress_queue = queue.Queue()
         self.create_widgets()
 
     def create_widgets(self):
@@ -41,6 +51,21 @@ class Application(tk.Frame):
         self.epochs = Placeholder(master=self.master, placeholder="70", width=50)
         self.epochs.grid(row=8, column=0, pady=10)
 
+        self.title = tk.Label(text="Boundary method:")
+        self.title.grid(row=9, column=0, pady=3)
+        self.boundary_menu = ttk.Combobox(values=BOUNDARIES)
+        self.boundary_menu.current(0)
+        self.boundary_menu.config(width=45)
+        self.boundary_menu.grid(row=10, column=0, pady=5)
+
+        self.title = tk.Label(text="Function:")
+        self.title.grid(row=9, column=1, pady=3)
+        self.function_menu = ttk.Combobox(values=list(FUNCTIONS))
+        self.function_menu.current(0)
+        self.function_menu.config(width=45)
+        self.function_menu.bind('<<ComboboxSelected>>', self.select_function)
+        self.function_menu.grid(row=10, column=1, pady=5)
+
         self.app_title = tk.Label(text="Generic Algorithm", font=("Courier 32 bold"))
         self.app_title.grid(row=0, column=1, pady=3)
 
@@ -92,55 +117,123 @@ class Application(tk.Frame):
         self.title = tk.Label(text="Result:", font=("Courier 16 bold"))
         self.title.grid(row=7, column=2, pady=3)
 
+        self.result = tk.Label(text="", font=("Courier 16 bold"))
+        self.result.grid(row=8, column=2, pady=3)
+
         self.title = tk.Label(text="Execute time:", font=("Courier 16 bold"))
         self.title.grid(row=9, column=2, pady=3)
 
+        self.execute_time = tk.Label(text="", font=("Courier 16 bold"))
+        self.execute_time.grid(row=10, column=2, pady=3)
+
+        self.progress = tk.Label(text="", font=("Courier 12"))
+        self.progress.grid(row=11, column=0, columnspan=2, pady=3)
+
+        self.cancel_button = tk.Button(text="CANCEL", font=('calibri', 10, 'bold', 'underline'), command=self.cancel,
+                                       foreground='Red', height=2, width=10, state=tk.DISABLED)
+        self.cancel_button.grid(row=11, column=2)
+
+        self.figure = Figure(figsize=(8, 3))
+        self.chart = self.figure.add_subplot()
+        self.chart_canvas = FigureCanvasTkAgg(self.figure, master=self.master)
+        self.chart_canvas.get_tk_widget().grid(row=12, column=0, columnspan=3, pady=5)
+
     def start(self):
-        begin_range = self.begin.value()
-        end_range = self.end.value()
+        if self.worker is not None and self.worker.is_alive():
+            return
+        benchmark = FUNCTIONS[self.function_menu.get()]
+        begin_range = float(self.begin.get())
+        end_range = float(self.end.get())
         population_amount = self.population.value()
         epochs_amount = self.epochs.value()
-        start = time.time()
-
-        GlobalData.set(begin_range=begin_range,
-                       end_range=end_range,
-                       function=goldstein_prize,
-                       population_amount=population_amount)
-        population_generator = Generator(population_amount, begin_range, end_range)
-        chromosome_pairs = population_generator.get_population()
-        bests_from_epochs = []
-        average_from_epochs = []
-        std_from_epochs = []
-
-        population = Population(chromosome_pairs=chromosome_pairs,
+        self.start_time = time.time()
+
+        context = RunContext(begin_range=begin_range,
+                             end_range=end_range,
+                             function=benchmark.function,
+                             population_amount=population_amount)
+        population_generator = Generator(population_amount, begin_range, end_range, context)
+        genes = population_generator.get_genes(benchmark.dimensions)
+        population = Population(chromosome_pairs=genes,
                                 mutation_method=self.mutation_menu.get(),
                                 cross_method=self.cross_menu.get(),
                                 selection_method=self.selection_menu.get(),
                                 cross_probability=float(self.cross_probab.get()),
                                 mutation_probability=float(self.mutation_probab.get()),
                                 selection_percent=int(self.selection.value()),
-                                maximalization=self.max_value.get()
+                                maximalization=self.max_value.get(),
+                                boundary_method=self.boundary_menu.get(),
+                                context=context
                                 )
-
-        for i in range(epochs_amount):
-            population.epoch()
-            bests_from_epochs.append(population.best.get_function_value())
-            fun_result = 0
-            stds = []
-            for chromosome_pair in population:
-                goldstein_prize_result = chromosome_pair.get_function_value()
-                fun_result += goldstein_prize_result
-                stds.append(goldstein_prize_result)
-            average_from_epochs.append(fun_result // population.population_size)
-            std_from_epochs.append(np.std(stds))
-
+        population.add_observer(lambda statistics: self.progress_queue.put((time.time(), statistics)))
+        self.history = History()
+        self.evaluations_to_target = EvaluationsToTarget(benchmark.optimum)
+        population.add_observer(self.evaluations_to_target)
+        self.last_refresh = 0
+        self.cancel_event.clear()
+        self.start.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.worker = threading.Thread(target=self.evolve, args=(population, epochs_amount), daemon=True)
+        self.worker.start()
+        self.after(POLL_INTERVAL, self.poll)
+
+    def select_function(self, event=None):
+        benchmark = FUNCTIONS[self.function_menu.get()]
+        self.begin.set(benchmark.begin_range)
+        self.end.set(benchmark.end_range)
+        self.max_value.set(False)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def evolve(self, population, epochs_amount):
+        try:
+            for i in range(epochs_amount):
+                if self.cancel_event.is_set():
+                    break
+                population.epoch()
+        finally:
+            self.progress_queue.put(None)
+
+    def poll(self):
+        finished = False
+        while True:
+            try:
+                item = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                finished = True
+                break
+            timestamp, statistics = item
+            self.history(statistics)
+            self.progress.config(text="Epoch: {}  best: {:.6g}  mean: {:.6g}  evals/s: {:.0f}".format(
+                statistics['epoch'], statistics['best'], statistics['mean'],
+                statistics['evaluations'] / max(timestamp - self.start_time, 1e-9)))
+        if finished or time.time() - self.last_refresh >= REFRESH_INTERVAL:
+            self.refresh_chart()
+        if finished:
+            self.finish()
+        else:
+            self.after(POLL_INTERVAL, self.poll)
+
+    def refresh_chart(self):
+        self.last_refresh = time.time()
+        self.chart.clear()
+        self.chart.set_xlabel('Epochs')
+        self.chart.set_ylabel('Results')
+        self.chart.plot(self.history['epoch'], self.history['best'], 'b')
+        self.chart_canvas.draw_idle()
+
+    def finish(self):
         end = time.time()
-        Plots.best_plot(bests_from_epochs)
-        Plots.average_plot(average_from_epochs)
-        Plots.std_plot(std_from_epochs)
-
-        self.title = tk.Label(text=population.best.get_function_value(), font=("Courier 16 bold"))
-        self.title.grid(row=8, column=2, pady=3)
-
-        self.title = tk.Label(text=str(end - start), font=("Courier 16 bold"))
-        self.title.grid(row=10, column=2, pady=3)
+        self.worker.join()
+        if self.history.records:
+            Plots.best_plot(self.history['best'])
+            Plots.average_plot(self.history['mean'])
+            Plots.std_plot(self.history['std'])
+            self.result.config(text=self.history['best'][-1])
+            self.progress.config(text="Evaluations to target: {}".format(self.evaluations_to_target.evaluations))
+        self.execute_time.config(text=str(end - self.start_time))
+        self.start.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
@@ -31,6 +31,11 @@ class Placeholder:
     def get(self):
         return self.e.get()
 
+    def set(self, value):
+        self.placeholder = value
+        self.e.delete(0, END)
+        self.e.insert(0, value)
+
     def focus_out(self, e):
         if self.e.get() == '':
             self.e.configure(fg=self.placeholdercolor)
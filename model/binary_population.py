@@ -0,0 +1,110 @@
+import logging
+
+import numpy as np
+
+from oe.data import GlobalData
+from oe.model.genome import individual, to_genes
+from oe.model.population import Population
+from oe.utils.bin_converter import Converter, pack, unpack
+
+ONE = np.uint64(1)
+
+
+class BinaryPopulation(Population):
+    def __init__(self, chromosome_pairs, precision=6, gray=False,
+                 mutation_method='ONE_POINT_MUTATION',
+                 cross_method='ONE_POINT',
+                 **parameters):
+        self.precision = precision
+        self.gray = gray
+        context = parameters.get('context') or GlobalData()
+        self.converter = Converter(context.begin_range, context.end_range, len(chromosome_pairs), precision, gray)
+        super().__init__(chromosome_pairs, mutation_method=mutation_method, cross_method=cross_method, **parameters)
+
+    @property
+    def best(self):
+        return individual(self.converter.decode(self.best_genes), self.best_fitness, self.context)
+
+    @property
+    def bits(self):
+        return self.dimensions * self.converter.length
+
+    def get_parameters(self):
+        return {**super().get_parameters(), 'precision': self.precision, 'gray': self.gray}
+
+    def mutation(self):
+        mask = self.context.rng.random(len(self.next_gen)) <= self.mutation_probability
+        logging.debug("{} chromosomes {}".format(self.mutation_method, np.count_nonzero(mask)))
+        if self.mutation_method == 'ONE_POINT_MUTATION':
+            self.next_gen[mask] = self._point_mutation(self.next_gen[mask], 1)
+        elif self.mutation_method == 'TWO_POINT_MUTATION':
+            self.next_gen[mask] = self._point_mutation(self.next_gen[mask], 2)
+        elif self.mutation_method == 'BIT_FLIP':
+            self.next_gen[mask] = self._bit_flip_mutation(self.next_gen[mask])
+        self.inversion()
+
+    def inversion(self):
+        mask = self.context.rng.random(len(self.next_gen)) <= self.inversion_probability
+        logging.debug("INVERSION chromosomes {}".format(np.count_nonzero(mask)))
+        self.next_gen[mask] = self._inversion(self.next_gen[mask])
+
+    def _to_genes(self, chromosome_pairs):
+        genes = chromosome_pairs if isinstance(chromosome_pairs, np.ndarray) else to_genes(chromosome_pairs)
+        return genes if genes.dtype == np.uint64 else self.converter.encode(genes)
+
+    def _diversity(self):
+        return float(np.std(self.converter.decode(self.genes), axis=0).mean())
+
+    def _evaluate(self, genes):
+        return self.context.evaluate(self.converter.decode(genes))
+
+    def _cross(self, amount):
+        pairings = -(-amount // 2)
+        parents1, parents2 = self.elite[self.context.rng.integers(0, len(self.elite), (2, pairings))]
+        if self.cross_method == 'ONE_POINT':
+            mask = self._prefix_mask(self.context.rng.integers(1, self.bits, pairings))
+        elif self.cross_method == 'TWO_POINT':
+            points = np.sort(self.context.rng.integers(1, self.bits, (pairings, 2)), axis=1)
+            mask = self._prefix_mask(points[:, 1]) ^ self._prefix_mask(points[:, 0])
+        elif self.cross_method == 'UNIFORM':
+            mask = self._random_words((pairings, self.dimensions))
+        difference = (parents1 ^ parents2) & mask
+        children = np.concatenate((parents2 ^ difference, parents1 ^ difference))
+        return children[:amount], np.full(amount, np.nan)
+
+    def _prefix_mask(self, points):
+        length = self.converter.length
+        bits_before = np.clip(points[:, None] - np.arange(self.dimensions) * length, 0, length).astype(np.uint64)
+        return ((ONE << bits_before) - ONE) << (np.uint64(length) - bits_before)
+
+    def _random_words(self, shape):
+        return self.context.rng.integers(0, int(self.converter.max_word) + 1, shape, dtype=np.uint64)
+
+    def _point_mutation(self, words, points):
+        words = words.copy()
+        rows = np.arange(len(words))
+        positions = self.context.rng.integers(0, self.bits, len(words))
+        for _ in range(points):
+            genes_indexes, bit_indexes = np.divmod(positions, self.converter.length)
+            words[rows, genes_indexes] ^= ONE << (self.converter.length - 1 - bit_indexes).astype(np.uint64)
+            positions = (positions + self.context.rng.integers(1, self.bits, len(words))) % self.bits
+        return words
+
+    def _bit_flip_mutation(self, words):
+        mask = np.zeros_like(words)
+        for shift in range(self.converter.length):
+            flips = self.context.rng.random(words.shape) < 1 / self.converter.length
+            mask |= flips.astype(np.uint64) << np.uint64(shift)
+        return words ^ mask
+
+    def _inversion(self, words):
+        bits = unpack(words, self.converter.length)
+        points = np.sort(self.context.rng.integers(0, self.bits + 1, (len(words), 2)), axis=1)
+        positions = np.arange(self.bits)
+        begin, end = points[:, :1], points[:, 1:]
+        inverted = (begin <= positions) & (positions < end)
+        order = np.where(inverted, begin + end - 1 - positions, positions)
+        return pack(np.take_along_axis(bits, order, axis=1), self.converter.length)
+
+    def __getitem__(self, index):
+        return individual(self.converter.decode(self.genes[index]), self.fitness[index], self.context)
@@ -1,5 +1,3 @@
-import random
-
 import numpy as np
 
 from oe.data import GlobalData
@@ -8,17 +6,34 @@ from oe.data import GlobalData
 class Chromosome:
     _value = None
 
-    def __init__(self, value):
+    def __init__(self, value, context=None, index=0):
         self.value = value
+        self._context = context
+        self.index = index
+
+    @property
+    def context(self):
+        return self._context if self._context is not None else GlobalData()
+
+    @property
+    def bounds(self):
+        begin_range, end_range = self.context.begin_range, self.context.end_range
+        if not np.isscalar(begin_range):
+            begin_range = begin_range[self.index]
+        if not np.isscalar(end_range):
+            end_range = end_range[self.index]
+        return float(begin_range), float(end_range)
 
     def uniform_mutation(self):
-        self.value = random.uniform(GlobalData().begin_range, GlobalData().end_range)
+        self.value = float(self.context.rng.uniform(*self.bounds))
 
-    def gauss_mutation(self):
-        while True:
-            self.value = self.value + np.random.normal()
-            if GlobalData().begin_range <= self.value <= GlobalData().end_range:
+    def gauss_mutation(self, max_resamples=10):
+        begin_range, end_range = self.bounds
+        for _ in range(max_resamples + 1):
+            value = self.value + self.context.rng.normal()
+            if begin_range <= value <= end_range:
                 break
+        self.value = float(min(max(value, begin_range), end_range))
 
     def __repr__(self):
         return ''.join([str(i) for i in self.value])
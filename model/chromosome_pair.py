@@ -3,20 +3,36 @@ from oe.model.chromosome import Chromosome
 
 
 class ChromosomePair:
-    def __init__(self, chromosome1: Chromosome, chromosome2: Chromosome):
+    def __init__(self, chromosome1: Chromosome, chromosome2: Chromosome, function_value=None, context=None):
         self.chromosome1 = chromosome1
         self.chromosome2 = chromosome2
+        self._function_value = function_value
+        self._context = context
+
+    @property
+    def context(self):
+        return self._context if self._context is not None else GlobalData()
 
     def uniform_mutation(self):
         self.chromosome1.uniform_mutation()
         self.chromosome2.uniform_mutation()
+        self.invalidate()
 
     def gauss_mutation(self):
         self.chromosome1.gauss_mutation()
         self.chromosome2.gauss_mutation()
+        self.invalidate()
+
+    def invalidate(self):
+        self._function_value = None
 
     def get_function_value(self):
-        return GlobalData().function(self.chromosome1.value, self.chromosome2.value)
+        if self._function_value is None:
+            self.context.cache_misses += 1
+            self._function_value = self.context.evaluate([[self.chromosome1.value, self.chromosome2.value]])[0]
+        else:
+            self.context.cache_hits += 1
+        return self._function_value
 
     def __getitem__(self, index):
         if index == 0:
@@ -25,7 +41,6 @@ class ChromosomePair:
             return self.chromosome2
 
     def __repr__(self):
-        function = GlobalData().function
         return " [" + repr(self.chromosome1.value) + " ; " + repr(self.chromosome2.value) + "] --> " + \
                str(self.get_function_value())
 
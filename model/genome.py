@@ -0,0 +1,74 @@
+import numpy as np
+
+from oe.data import GlobalData
+from oe.model.chromosome import Chromosome
+from oe.model.chromosome_pair import ChromosomePair
+from oe.utils.distributions import truncated_normal
+
+
+class Genome:
+    def __init__(self, values, function_value=None, context=None):
+        self.values = np.asarray(values, dtype=float)
+        self._function_value = function_value
+        self._context = context
+
+    @property
+    def context(self):
+        return self._context if self._context is not None else GlobalData()
+
+    def uniform_mutation(self):
+        self.values = self.context.rng.uniform(self.context.begin_range, self.context.end_range, self.values.shape)
+        self.invalidate()
+
+    def gauss_mutation(self):
+        self.values = self.values + truncated_normal(self.context.begin_range - self.values,
+                                                     self.context.end_range - self.values, self.context.rng)
+        self.invalidate()
+
+    def invalidate(self):
+        self._function_value = None
+
+    def get_function_value(self):
+        if self._function_value is None:
+            self.context.cache_misses += 1
+            self._function_value = self.context.evaluate(self.values[None])[0]
+        else:
+            self.context.cache_hits += 1
+        return self._function_value
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __repr__(self):
+        return " [" + " ; ".join(repr(float(value)) for value in self.values) + "] --> " + \
+               str(self.get_function_value())
+
+    def __le__(self, other):
+        return self.get_function_value() <= other.get_function_value()
+
+    def __ge__(self, other):
+        return self.get_function_value() >= other.get_function_value()
+
+    def __lt__(self, other):
+        return self.get_function_value() < other.get_function_value()
+
+    def __gt__(self, other):
+        return self.get_function_value() > other.get_function_value()
+
+
+def individual(genes, function_value=None, context=None):
+    if function_value is not None:
+        function_value = float(function_value)
+    if len(genes) == 2:
+        return ChromosomePair(Chromosome(float(genes[0]), context, 0), Chromosome(float(genes[1]), context, 1),
+                              function_value, context)
+    return Genome(np.array(genes, dtype=float), function_value, context)
+
+
+def to_genes(individuals):
+    return np.array([individual.values if isinstance(individual, Genome)
+                     else [individual.chromosome1.value, individual.chromosome2.value]
+                     for individual in individuals], dtype=float)
@@ -0,0 +1,83 @@
+import multiprocessing
+
+import numpy as np
+
+from oe.data import RunContext, goldstein_prize
+from oe.model.genome import individual
+from oe.model.population import Population
+from oe.utils.generator import Generator
+
+
+def get_neighbours(index, islands_amount, topology):
+    if topology == 'RING':
+        return [(index + 1) % islands_amount] if islands_amount > 1 else []
+    elif topology == 'FULL':
+        return [i for i in range(islands_amount) if i != index]
+    raise ValueError(f'Unknown topology: {topology}')
+
+
+def evolve_island(index, seed, channels, results, global_data, dimensions, epochs, migration_interval,
+                  migrants_amount, parameters):
+    context = RunContext(seed=seed, **global_data)
+    population_generator = Generator(global_data['population_amount'], global_data['begin_range'],
+                                     global_data['end_range'], context)
+    population = Population(population_generator.get_genes(dimensions), context=context, **parameters)
+    outboxes = [queue for (sender, _), queue in sorted(channels.items()) if sender == index]
+    inboxes = [queue for (_, receiver), queue in sorted(channels.items()) if receiver == index]
+    for epoch in range(1, epochs + 1):
+        population.epoch()
+        if epoch % migration_interval == 0 and epoch != epochs:
+            genes, fitness = population.get_best(migrants_amount)
+            migrants = np.column_stack((genes, fitness))
+            for outbox in outboxes:
+                outbox.put(migrants)
+            for inbox in inboxes:
+                migrants = inbox.get()
+                population.replace_worst(migrants[:, :-1], migrants[:, -1])
+    genes, fitness = population.get_best(1)
+    results.put((index, np.append(genes[0], fitness[0])))
+
+
+class Islands:
+    def __init__(self, islands_parameters: list[dict], begin_range, end_range, population_amount,
+                 function=goldstein_prize, migration_interval=10, migrants_amount=1, topology='RING',
+                 maximalization=False, dimensions=2, seed=None):
+        self.islands_parameters = [{'maximalization': maximalization, **parameters}
+                                   for parameters in islands_parameters]
+        self.global_data = {'begin_range': begin_range, 'end_range': end_range,
+                            'population_amount': population_amount, 'function': function}
+        self.migration_interval = migration_interval
+        self.migrants_amount = migrants_amount
+        self.topology = topology
+        self.maximalization = maximalization
+        self.dimensions = dimensions
+        self.seeds = [int(child.generate_state(1)[0])
+                      for child in np.random.SeedSequence(seed).spawn(len(self.islands_parameters))]
+        self.context = RunContext(**self.global_data)
+        self.results = []
+
+    def run(self, epochs):
+        islands_amount = len(self.islands_parameters)
+        channels = {(sender, receiver): multiprocessing.Queue() for sender in range(islands_amount)
+                    for receiver in get_neighbours(sender, islands_amount, self.topology)}
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=evolve_island,
+                                             args=(index, self.seeds[index], channels, results, self.global_data,
+                                                   self.dimensions, epochs, self.migration_interval,
+                                                   self.migrants_amount, parameters))
+                     for index, parameters in enumerate(self.islands_parameters)]
+        for process in processes:
+            process.start()
+        self.results = [None] * islands_amount
+        for _ in range(islands_amount):
+            index, result = results.get()
+            self.results[index] = result
+        for process in processes:
+            process.join()
+        return self.best
+
+    @property
+    def best(self):
+        selector = max if self.maximalization else min
+        result = selector(self.results, key=lambda x: x[-1])
+        return individual(result[:-1], result[-1], self.context)
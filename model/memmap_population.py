@@ -0,0 +1,211 @@
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+
+from oe.data import GlobalData
+from oe.model.genome import to_genes
+from oe.model.population import Population
+
+BINS = 1024
+
+
+class MemmapPopulation(Population):
+    def __init__(self, chromosome_pairs, directory=None, chunk_size=65536, fitness=None, **parameters):
+        self.chunk_size = chunk_size
+        self.temporary = directory is None
+        self.directory = tempfile.mkdtemp(prefix='population-') if directory is None else directory
+        self.cleanup = weakref.finalize(self, shutil.rmtree, self.directory, True) if self.temporary else None
+        self.context = parameters.get('context') or GlobalData()
+        genes = chromosome_pairs if isinstance(chromosome_pairs, np.ndarray) else to_genes(chromosome_pairs)
+        amount, dimensions = genes.shape
+        self.buffers = [(self._map(f'genes{i}', (amount, dimensions)), self._map(f'fitness{i}', (amount,)))
+                        for i in range(2)]
+        self.elite_indexes = self._map('elite', (amount,), np.int64)
+        self.distribuants = self._map('distribuants', (amount,))
+        self.elite_amount = 0
+        current_genes, current_fitness = self.buffers[0]
+        for start, stop in self._chunks(amount):
+            current_genes[start:stop] = genes[start:stop]
+            current_fitness[start:stop] = self._evaluate(current_genes[start:stop]) if fitness is None \
+                else fitness[start:stop]
+        self.next_genes, self.next_fitness = self.buffers[1]
+        super().__init__(current_genes, fitness=current_fitness, **parameters)
+
+    def get_parameters(self):
+        return {**super().get_parameters(), 'chunk_size': self.chunk_size}
+
+    def selection(self):
+        if self.selection_method == 'BEST':
+            self.elite_amount = self._write_best_selection()
+        elif self.selection_method == 'ROULETTE':
+            self.elite_amount = self._write_roulette_selection()
+        elif self.selection_method == 'SUS':
+            self.elite_amount = self._write_stochastic_universal_sampling()
+        elif self.selection_method == 'TOURNAMENT':
+            self.elite_amount = self._write_tournament_selection()
+
+    def cross(self):
+        amount = self.population_size - len(self.best_indexes)
+        for start, stop in self._chunks(amount):
+            self.next_genes[start:stop], self.next_fitness[start:stop] = self._cross(stop - start)
+        self.next_gen, self.next_gen_fitness = self.next_genes[:amount], self.next_fitness[:amount]
+
+    def evaluation(self):
+        for start, stop in self._chunks(len(self.next_gen)):
+            self._evaluate_invalid(self.next_gen[start:stop], self.next_gen_fitness[start:stop])
+
+    def replacement(self):
+        amount = len(self.next_gen)
+        self.next_genes[amount:] = self.genes[self.best_indexes]
+        self.next_fitness[amount:] = self.fitness[self.best_indexes]
+        self.genes, self.next_genes = self.next_genes, self.genes
+        self.fitness, self.next_fitness = self.next_fitness, self.fitness
+        self._store_best_chromosomes()
+
+    def close(self):
+        self.buffers, self.elite_indexes, self.distribuants = None, None, None
+        self.genes = self.fitness = self.next_genes = self.next_fitness = self.next_gen = self.elite = None
+        if self.cleanup is not None:
+            self.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def _map(self, name, shape, dtype=float):
+        return np.memmap(os.path.join(self.directory, name + '.dat'), dtype=dtype, mode='w+', shape=shape)
+
+    def _chunks(self, amount):
+        return ((start, min(start + self.chunk_size, amount)) for start in range(0, amount, self.chunk_size))
+
+    def _to_genes(self, genes):
+        return genes
+
+    @staticmethod
+    def _to_fitness(fitness):
+        return fitness
+
+    def _execute_transformation_with_given_probability(self, probability, transformation):
+        for start, stop in self._chunks(len(self.next_gen)):
+            self._transform(self.next_gen[start:stop], self.next_gen_fitness[start:stop], probability, transformation)
+
+    def _get_random_pairs_for_crossing(self, amount):
+        indexes = self.context.rng.integers(0, self.elite_amount, (2, amount, self.dimensions))
+        return self.genes[self.elite_indexes[indexes], np.arange(self.dimensions)]
+
+    def _get_best_indexes(self, amount, worst=False, ordered=True):
+        sign = -1 if self.maximalization != worst else 1
+        indexes, keys = np.empty(0, dtype=np.int64), np.empty(0)
+        for start, stop in self._chunks(self.population_size):
+            chunk_keys = sign * self.fitness[start:stop]
+            size = min(amount, stop - start)
+            local = np.argpartition(chunk_keys, size - 1)[:size] if size < stop - start else np.arange(stop - start)
+            indexes, keys = np.concatenate((indexes, local + start)), np.concatenate((keys, chunk_keys[local]))
+            if len(indexes) > amount:
+                order = np.lexsort((indexes, keys))[:amount]
+                indexes, keys = indexes[order], keys[order]
+        return indexes[np.lexsort((indexes, keys))]
+
+    def _kth_smallest(self, sign, rank):
+        low, high, closed = -np.inf, np.inf, True
+        while True:
+            count, minimum, maximum = 0, np.inf, -np.inf
+            for keys in self._keys_in_range(sign, low, high, closed):
+                count += keys.size
+                if keys.size:
+                    minimum, maximum = min(minimum, keys.min()), max(maximum, keys.max())
+            if minimum == maximum:
+                return float(minimum)
+            if count <= self.chunk_size:
+                keys = np.concatenate(list(self._keys_in_range(sign, low, high, closed)))
+                return float(np.partition(keys, rank)[rank])
+            edges = np.linspace(minimum, maximum, BINS + 1)
+            counts = np.zeros(BINS, dtype=np.int64)
+            for keys in self._keys_in_range(sign, low, high, closed):
+                counts += np.bincount(np.clip(np.searchsorted(edges, keys, side='right') - 1, 0, BINS - 1),
+                                      minlength=BINS)
+            cumulative = np.cumsum(counts)
+            selected = int(np.searchsorted(cumulative, rank, side='right'))
+            rank -= cumulative[selected] - counts[selected]
+            low, high, closed = edges[selected], edges[selected + 1], selected == BINS - 1
+
+    def _keys_in_range(self, sign, low, high, closed):
+        for start, stop in self._chunks(self.population_size):
+            keys = sign * self.fitness[start:stop]
+            yield keys[(keys >= low) & ((keys <= high) if closed else (keys < high))]
+
+    def _write_best_selection(self):
+        amount = self.selection_amount
+        sign = -1 if self.maximalization else 1
+        threshold = self._kth_smallest(sign, amount - 1)
+        written = 0
+        for comparison in (np.less, np.equal):
+            for start, stop in self._chunks(self.population_size):
+                chosen = (np.flatnonzero(comparison(sign * self.fitness[start:stop], threshold)) + start)
+                chosen = chosen[:amount - written]
+                self.elite_indexes[written:written + len(chosen)] = chosen
+                written += len(chosen)
+        return written
+
+    def _write_distribuants(self):
+        total = 0.0
+        for start, stop in self._chunks(self.population_size):
+            total += self._selection_values(start, stop).sum()
+        cumulative = 0.0
+        for start, stop in self._chunks(self.population_size):
+            values = self._selection_values(start, stop)
+            self.distribuants[start:stop] = (cumulative + np.cumsum(values)) / total
+            cumulative += values.sum()
+        self.distribuants[-1] = 1.0
+
+    def _selection_values(self, start, stop):
+        fitness = self.fitness[start:stop]
+        return fitness if self.maximalization else 1 / fitness
+
+    def _write_roulette_selection(self):
+        self._write_distribuants()
+        for start, stop in self._chunks(self.selection_amount):
+            indexes = np.searchsorted(self.distribuants, self.context.rng.random(stop - start), side='right')
+            self.elite_indexes[start:stop] = np.minimum(indexes, self.population_size - 1)
+        return self.selection_amount
+
+    def _write_stochastic_universal_sampling(self):
+        self._write_distribuants()
+        offset = self.context.rng.random()
+        written, previous = 0, 0
+        for start, stop in self._chunks(self.population_size):
+            pointers_before = np.ceil(self.distribuants[start:stop] * self.selection_amount - offset)
+            counts = np.diff(pointers_before, prepend=previous).astype(int)
+            previous = pointers_before[-1]
+            chosen = np.repeat(np.arange(start, stop), counts)
+            self.elite_indexes[written:written + len(chosen)] = chosen
+            written += len(chosen)
+        return written
+
+    def _write_tournament_selection(self):
+        for start, stop in self._chunks(self.selection_amount):
+            self.elite_indexes[start:stop] = self._tournament_winners(stop - start)
+        return self.selection_amount
+
+    def _fitness_statistics(self):
+        mean = sum(float(self.fitness[start:stop].sum()) for start, stop in self._chunks(self.population_size)) \
+            / self.population_size
+        variance = sum(float(((self.fitness[start:stop] - mean) ** 2).sum())
+                       for start, stop in self._chunks(self.population_size)) / self.population_size
+        middle = self.population_size // 2
+        median = self._kth_smallest(1, middle)
+        if self.population_size % 2 == 0:
+            median = (median + self._kth_smallest(1, middle - 1)) / 2
+        return {'mean': mean, 'std': float(np.sqrt(variance)), 'median': median}
+
+    def _diversity(self):
+        mean = sum(self.genes[start:stop].sum(axis=0) for start, stop in self._chunks(self.population_size)) \
+            / self.population_size
+        variance = sum(((self.genes[start:stop] - mean) ** 2).sum(axis=0)
+                       for start, stop in self._chunks(self.population_size)) / self.population_size
+        return float(np.sqrt(variance).mean())
@@ -1,32 +1,60 @@
-import copy
+import json
 import logging
-import random
+import os
 
 import numpy as np
 
-from oe.data import GlobalData
-from oe.model.chromosome import Chromosome
+from oe.data import FUNCTIONS, GlobalData, RunContext
 from oe.model.chromosome_pair import ChromosomePair
+from oe.model.genome import Genome, individual, to_genes
+from oe.utils.distributions import truncated_normal
 
 
-def validate_value_in_range_after_crossing(f):
-    def wrapper(*args, **kwargs):
-        while True:
-            results = f(*args, **kwargs)
-            for value in results:
-                if GlobalData().begin_range <= value <= GlobalData().end_range:
-                    return results
+def genes_out_of_range(context, genes):
+    return (genes < context.begin_range) | (genes > context.end_range)
 
-    return wrapper
+
+def in_range(context, genes):
+    return ~genes_out_of_range(context, genes).any(axis=-1)
+
+
+def repair(context, genes, boundary_method):
+    begin_range, end_range = context.begin_range, context.end_range
+    width = end_range - begin_range
+    if boundary_method == 'REFLECT':
+        offset = np.mod(genes - begin_range, 2 * width)
+        return begin_range + np.where(offset > width, 2 * width - offset, offset)
+    elif boundary_method == 'WRAP':
+        return begin_range + np.mod(genes - begin_range, width)
+    return np.clip(genes, begin_range, end_range)
+
+
+def uniform_mutation(context, genes, boundary_method='RESAMPLE', max_resamples=10, profiler=None):
+    return context.rng.uniform(context.begin_range, context.end_range, genes.shape)
+
+
+def gauss_mutation(context, genes, boundary_method='RESAMPLE', max_resamples=10, profiler=None):
+    if boundary_method == 'TRUNCATED':
+        return genes + truncated_normal(context.begin_range - genes, context.end_range - genes, context.rng)
+    mutated = genes + context.rng.normal(size=genes.shape)
+    invalid = genes_out_of_range(context, mutated)
+    for _ in range(max_resamples if boundary_method == 'RESAMPLE' else 0):
+        if not invalid.any():
+            break
+        if profiler is not None:
+            profiler.count('gauss_redraws', np.count_nonzero(invalid))
+        mutated[invalid] = genes[invalid] + context.rng.normal(size=np.count_nonzero(invalid))
+        invalid = genes_out_of_range(context, mutated)
+    return repair(context, mutated, boundary_method)
 
 
 class Population:
     transformations = {
-        'UNIFORM': ChromosomePair.uniform_mutation,
-        'GAUSS': ChromosomePair.gauss_mutation,
+        'UNIFORM': uniform_mutation,
+        'GAUSS': gauss_mutation,
     }
 
-    def __init__(self, chromosome_pairs: list[ChromosomePair],
+    def __init__(self, chromosome_pairs: list[ChromosomePair] | list[Genome] | np.ndarray,
                  mutation_method='ONE_POINT_MUTATION',
                  cross_method='ONE_POINT',
                  selection_method='ROULETTE',
@@ -34,9 +62,17 @@ class Population:
                  mutation_probability=0.5,
                  inversion_probability=0.5,
                  selection_percent=50,
-                 maximalization=False):
-        self.chromosome_pairs = chromosome_pairs
-        self.new_generation = []
+                 maximalization=False,
+                 boundary_method='RESAMPLE',
+                 max_resamples=10,
+                 elitism=1,
+                 tournament_size=None,
+                 fitness=None,
+                 profiler=None,
+                 context=None):
+        self.context = context if context is not None else GlobalData()
+        self.genes = self._to_genes(chromosome_pairs)
+        self.fitness = self._evaluate(self.genes) if fitness is None else self._to_fitness(fitness)
         self.mutation_method = mutation_method
         self.cross_method = cross_method
         self.selection_method = selection_method
@@ -45,213 +81,355 @@ class Population:
         self.selection_percent = selection_percent
         self.inversion_probability = inversion_probability
         self.maximalization = maximalization
-        self.sort()
-        self.elite = self.chromosome_pairs[:selection_percent // 100 * self.population_size]
-        self.next_gen = []
+        self.boundary_method = boundary_method
+        self.max_resamples = max_resamples
+        self.elitism = elitism
+        self.tournament_size = tournament_size
+        self.profiler = profiler
+        self.best_genes, self.best_fitness = None, None
+        self.epoch_number = 0
+        self.stop_reason = None
+        self.observers = []
+        self.last_statistics = None
+        if fitness is None:
+            self.sort()
+        self.elite = self.genes[:self.selection_amount]
+        self.next_gen = np.empty((0, self.dimensions))
+        self.next_gen_fitness = np.empty(0)
+        self._store_best_chromosomes()
 
     def mutation(self):
         self._execute_transformation_with_given_probability(self.mutation_probability, self.mutation_method)
 
     def cross(self):
-        self.next_gen = []
-        while len(self.next_gen) < self.population_size:
-            if np.random.random_sample() <= self.cross_probability:
-                children = self._cross()
-                self.next_gen.extend(children)
-        self.next_gen = self.next_gen[:self.population_size - 1]
+        self.next_gen, self.next_gen_fitness = self._cross(self.population_size - len(self.best_indexes))
 
     def selection(self):
         if self.selection_method == 'BEST':
-            self.elite = self._best_selection()
+            self.elite = self.genes[self._best_selection()]
         elif self.selection_method == 'ROULETTE':
-            self.elite = self._roulette_selection()
+            self.elite = self.genes[self._roulette_selection()]
+        elif self.selection_method == 'SUS':
+            self.elite = self.genes[self._stochastic_universal_sampling()]
         elif self.selection_method == 'TOURNAMENT':
-            self.elite = self._tournament_selection()
+            self.elite = self.genes[self._tournament_selection()]
 
     def epoch(self):
+        if self.profiler is None:
+            self.selection()
+            self.cross()
+            self.mutation()
+            self.evaluation()
+            self.replacement()
+        else:
+            self.profiler.profile_epoch(self)
+        self.epoch_number += 1
+        self._notify_observers()
+
+    def evaluation(self):
+        self._evaluate_invalid(self.next_gen, self.next_gen_fitness)
+
+    def replacement(self):
+        self.genes = np.vstack((self.next_gen, self.genes[self.best_indexes]))
+        self.fitness = np.concatenate((self.next_gen_fitness, self.fitness[self.best_indexes]))
         self._store_best_chromosomes()
-        self.selection()
-        self.cross()
-        self.mutation()
-        self.chromosome_pairs = self.next_gen
-        self.chromosome_pairs.append(self.best)
+
+    def evolve(self, epochs, stopping_criteria=None):
+        self.stop_reason = 'EPOCHS'
+        if stopping_criteria is not None:
+            stopping_criteria.reset()
+        for i in range(epochs):
+            self.epoch()
+            if stopping_criteria is not None:
+                statistics = self.last_statistics if self.last_statistics is not None else self.statistics()
+                reason = stopping_criteria(statistics)
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
+        return self.stop_reason
+
+    def get_parameters(self):
+        return {'mutation_method': self.mutation_method,
+                'cross_method': self.cross_method,
+                'selection_method': self.selection_method,
+                'cross_probability': self.cross_probability,
+                'mutation_probability': self.mutation_probability,
+                'inversion_probability': self.inversion_probability,
+                'selection_percent': self.selection_percent,
+                'maximalization': self.maximalization,
+                'boundary_method': self.boundary_method,
+                'max_resamples': self.max_resamples,
+                'elitism': self.elitism,
+                'tournament_size': self.tournament_size}
+
+    def save_checkpoint(self, path):
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'wb') as file:
+            np.savez(file,
+                     genes=self.genes,
+                     fitness=self.fitness,
+                     best_genes=self.best_genes,
+                     best_fitness=self.best_fitness,
+                     epoch_number=self.epoch_number,
+                     parameters=json.dumps(self.get_parameters()),
+                     counters=[self.context.evaluate.evaluations, self.context.cache_hits,
+                               self.context.cache_misses],
+                     rng_state=json.dumps(self.context.rng.bit_generator.state),
+                     begin_range=self.context.begin_range,
+                     end_range=self.context.end_range,
+                     function=self.context.function.__name__)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load_checkpoint(cls, path, context=None):
+        with np.load(path) as checkpoint:
+            context = cls._checkpoint_context(checkpoint, context)
+            population = cls(checkpoint['genes'], fitness=checkpoint['fitness'], context=context,
+                             **json.loads(str(checkpoint['parameters'])))
+            population.best_genes = checkpoint['best_genes']
+            population.best_fitness = float(checkpoint['best_fitness'])
+            population.epoch_number = int(checkpoint['epoch_number'])
+            (population.context.evaluate.evaluations, population.context.cache_hits,
+             population.context.cache_misses) = checkpoint['counters'].tolist()
+            population.context.rng.bit_generator.state = json.loads(str(checkpoint['rng_state']))
+        return population
+
+    @staticmethod
+    def _checkpoint_context(checkpoint, context):
+        begin_range, end_range = checkpoint['begin_range'], checkpoint['end_range']
+        function = str(checkpoint['function'])
+        if context is None:
+            functions = {benchmark.function.__name__: benchmark.function for benchmark in FUNCTIONS.values()}
+            if function not in functions:
+                raise ValueError(f'Checkpoint objective {function} is not a known benchmark, pass a context')
+            return RunContext(begin_range if begin_range.ndim else float(begin_range),
+                              end_range if end_range.ndim else float(end_range),
+                              len(checkpoint['genes']), function=functions[function])
+        if context.function.__name__ != function:
+            raise ValueError(f'Checkpoint was saved for {function}, not {context.function.__name__}')
+        if not (np.array_equal(context.begin_range, begin_range) and np.array_equal(context.end_range, end_range)):
+            raise ValueError('Checkpoint was saved with different bounds')
+        return context
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def statistics(self):
+        return {'epoch': self.epoch_number,
+                'best': self.best_fitness,
+                **self._fitness_statistics(),
+                'diversity': self._diversity(),
+                'evaluations': self.context.evaluate.evaluations,
+                **(self.profiler.last_epoch if self.profiler is not None else {})}
 
     @property
     def population_size(self):
-        return len(self.chromosome_pairs)
+        return len(self.genes)
+
+    @property
+    def best(self):
+        return individual(self.best_genes, self.best_fitness, self.context)
+
+    @property
+    def dimensions(self):
+        return self.genes.shape[1]
+
+    @property
+    def selection_amount(self):
+        return self.population_size * self.selection_percent // 100
+
+    @property
+    def chromosome_pairs(self):
+        return [self[index] for index in range(self.population_size)]
+
+    @staticmethod
+    def _to_genes(chromosome_pairs):
+        if isinstance(chromosome_pairs, np.ndarray):
+            return np.array(chromosome_pairs, dtype=float)
+        return to_genes(chromosome_pairs)
+
+    @staticmethod
+    def _to_fitness(fitness):
+        return np.array(fitness, dtype=float)
+
+    def _evaluate(self, genes):
+        return self.context.evaluate(genes)
+
+    def _evaluate_invalid(self, genes, fitness):
+        invalid = np.isnan(fitness)
+        misses = np.count_nonzero(invalid)
+        self.context.cache_misses += misses
+        self.context.cache_hits += len(invalid) - misses
+        fitness[invalid] = self._evaluate(genes[invalid])
+
+    def _fitness_statistics(self):
+        return {'mean': float(np.mean(self.fitness)),
+                'std': float(np.std(self.fitness)),
+                'median': float(np.median(self.fitness))}
+
+    def _notify_observers(self):
+        self.last_statistics = self.statistics() if self.observers else None
+        for observer in self.observers:
+            observer(self.last_statistics)
+
+    def _diversity(self):
+        return float(np.std(self.genes, axis=0).mean())
 
     def _store_best_chromosomes(self):
-        selector = max if self.maximalization else min
-        best = selector(self.chromosome_pairs)
-        best_copy = copy.deepcopy(best)
-        self.best = best_copy
+        indexes = self._get_best_indexes(max(self.elitism, 1))
+        self.best_indexes = indexes[:self.elitism]
+        if self.best_fitness is None or self._is_better(self.fitness[indexes[0]], self.best_fitness):
+            self.best_genes, self.best_fitness = self.genes[indexes[0]].copy(), float(self.fitness[indexes[0]])
+
+    def _is_better(self, value, other):
+        return value > other if self.maximalization else value < other
+
+    def _get_best_indexes(self, amount, worst=False, ordered=True):
+        keys = -self.fitness if self.maximalization != worst else self.fitness
+        amount = min(amount, self.population_size)
+        if amount < self.population_size:
+            indexes = np.argpartition(keys, amount - 1)[:amount]
+        else:
+            indexes = np.arange(self.population_size)
+        return indexes[np.argsort(keys[indexes], kind='stable')] if ordered else indexes
 
     def _execute_transformation_with_given_probability(self, probability, transformation):
-        for chromosome_pair in self.next_gen:
-            if np.random.random_sample() <= probability:
-                logging.debug("{} chromosomes {}".format(transformation, chromosome_pair))
-                self.transformations[transformation](chromosome_pair)
-
-    def _get_random_pair_for_crossing(self, chromosome_index=0) -> tuple[Chromosome, Chromosome]:
-        index1 = np.random.randint(0, len(self.elite))
-        index2 = np.random.randint(0, len(self.elite))
-        return self.elite[index1][chromosome_index], self.elite[index2][chromosome_index]
-
-    def _cross(self):
-        parent_11, parent_12 = self._get_random_pair_for_crossing(chromosome_index=0)
-        parent_21, parent_22 = self._get_random_pair_for_crossing(chromosome_index=1)
-        child_11, child_12, child_21, child_22 = None, None, None, None
-        if self.cross_method == 'ARITHMETIC':
-            child_11, child_12, child_21, child_22 = self._arithmetic_cross(parent_11, parent_12, parent_21, parent_22)
-        elif self.cross_method == 'BLEND_ALPHA':
-            child_11, child_12, child_21, child_22 = self._blend_cross_alpha(parent_11, parent_12, parent_21, parent_22)
-        elif self.cross_method == 'BLEND_ALPHA_BETA':
-            child_11, child_12, child_21, child_22 = self._blend_cross_alpha_beta(parent_11, parent_12, parent_21,
-                                                                                  parent_22)
-        elif self.cross_method == 'AVERAGE':
-            child_11, child_12, child_21, child_22 = self._average_cross(parent_11, parent_12, parent_21, parent_22)
-        elif self.cross_method == 'LINEAR':
-            child_11, child_12, child_21, child_22 = self._linear_cross(parent_11, parent_12, parent_21, parent_22)
-        return ChromosomePair(Chromosome(child_11), Chromosome(child_21)), \
-               ChromosomePair(Chromosome(child_12), Chromosome(child_22))
-
-    @validate_value_in_range_after_crossing
-    def _arithmetic_cross(self, parent_11, parent_12, parent_21, parent_22):
-        k = random.random()
-        child_11 = k * parent_11.value + (1 - k) * parent_12.value
-        child_12 = k * parent_12.value + (1 - k) * parent_11.value
-        child_21 = k * parent_21.value + (1 - k) * parent_22.value
-        child_22 = k * parent_22.value + (1 - k) * parent_21.value
-        return child_11, child_12, child_21, child_22
-
-    @validate_value_in_range_after_crossing
-    def _blend_cross_alpha(self, parent_11, parent_12, parent_21, parent_22):
-        d1, d2 = abs(parent_11.value - parent_12.value), abs(parent_21.value - parent_22.value)
-        alpha = random.random()
-        child_11 = random.uniform(min(parent_11.value, parent_12.value) - alpha * d1,
-                                  max(parent_11.value, parent_12.value) + alpha * d1)
-        child_12 = random.uniform(min(parent_11.value, parent_12.value) - alpha * d1,
-                                  max(parent_11.value, parent_12.value) + alpha * d1)
-        child_21 = random.uniform(min(parent_21.value, parent_22.value) - alpha * d2,
-                                  max(parent_21.value, parent_22.value) + alpha * d2)
-        child_22 = random.uniform(min(parent_21.value, parent_22.value) - alpha * d2,
-                                  max(parent_21.value, parent_22.value) + alpha * d2)
-        return child_11, child_12, child_21, child_22
-
-    @validate_value_in_range_after_crossing
-    def _blend_cross_alpha_beta(self, parent_11, parent_12, parent_21, parent_22):
-        d1, d2 = abs(parent_11.value - parent_12.value), abs(parent_21.value - parent_22.value)
-        alpha, beta = random.random(), random.random()
-        child_11 = random.uniform(min(parent_11.value, parent_12.value) - alpha * d1,
-                                  max(parent_11.value, parent_12.value) + beta * d1)
-        child_12 = random.uniform(min(parent_11.value, parent_12.value) - alpha * d1,
-                                  max(parent_11.value, parent_12.value) + beta * d1)
-        child_21 = random.uniform(min(parent_21.value, parent_22.value) - alpha * d2,
-                                  max(parent_21.value, parent_22.value) + beta * d2)
-        child_22 = random.uniform(min(parent_21.value, parent_22.value) - alpha * d2,
-                                  max(parent_21.value, parent_22.value) + beta * d2)
-        return child_11, child_12, child_21, child_22
-
-    @validate_value_in_range_after_crossing
-    def _average_cross(self, parent_11, parent_12, parent_21, parent_22):
-        child_11 = np.average((parent_11.value, parent_12.value))
-        child_21 = np.average((parent_21.value, parent_22.value))
-        child_12 = np.average((parent_11.value, parent_12.value))
-        child_22 = np.average((parent_21.value, parent_22.value))
-        return child_11, child_12, child_21, child_22
-
-    @validate_value_in_range_after_crossing
-    def _linear_cross(self, parent_11, parent_12, parent_21, parent_22):
-        z_x, z_y = (1 / 2) * parent_11.value + (1 / 2) * parent_12.value, (1 / 2) * parent_21.value + (
-                    1 / 2) * parent_22.value
-        v_x, v_y = (3 / 2) * parent_11.value - (1 / 2) * parent_12.value, (3 / 2) * parent_21.value - (
-                    1 / 2) * parent_22.value
-        w_x, w_y = (-1 / 2) * parent_11.value + (3 / 2) * parent_12.value, (-1 / 2) * parent_21.value + (
-                    3 / 2) * parent_22.value
-        res = [z_x, z_y, v_x, v_y, w_x, w_y]
-        eliminator = min if self.maximalization else max
-        function = GlobalData().function
-        weakest = eliminator(
-            ((z_x, z_y), function(z_x, z_y)),
-            ((v_x, v_y), function(v_x, v_y)),
-            ((w_x, w_y), function(w_x, w_y)), key=lambda x: x[1])
-        res.remove(weakest[0][0])
-        res.remove(weakest[0][1])
-        return tuple(res)
-
-    def _get_pairs_and_function_values(self):
-        return [(chromosome_pair, chromosome_pair.get_function_value())
-                for chromosome_pair in self.chromosome_pairs]
-
-    def _get_pairs_and_probabilities(self):
-        pairs_and_values = self._get_pairs_and_function_values()
-        if not self.maximalization:
-            pairs_and_values = [(x[0], 1 / x[1]) for x in pairs_and_values]
-        sum_of_function_values = sum([x[1] for x in pairs_and_values])
-        return sorted([(x[0], x[1] / sum_of_function_values) for x in pairs_and_values], key=lambda x: x[1])
-
-    def _get_pairs_and_distribuants(self):
-        pairs_and_distribuants = []
-        pairs_and_probabilities = self._get_pairs_and_probabilities()
-        previous_prob = 0
-        for pair, probability in pairs_and_probabilities:
-            pairs_and_distribuants.append((pair, probability + previous_prob))
-            previous_prob = probability
-        return pairs_and_distribuants
+        self._transform(self.next_gen, self.next_gen_fitness, probability, transformation)
+
+    def _transform(self, genes, fitness, probability, transformation):
+        mask = self.context.rng.random(len(genes)) <= probability
+        logging.debug("{} chromosomes {}".format(transformation, np.count_nonzero(mask)))
+        genes[mask] = self.transformations[transformation](self.context, genes[mask], self.boundary_method,
+                                                           self.max_resamples, self.profiler)
+        fitness[mask] = np.nan
+
+    def _get_random_pairs_for_crossing(self, amount):
+        indexes = self.context.rng.integers(0, len(self.elite), (2, amount, self.dimensions))
+        return self.elite[indexes, np.arange(self.dimensions)]
+
+    def _cross(self, amount):
+        pairings = -(-amount // 2)
+        children = np.empty((2 * pairings, self.dimensions))
+        children_fitness = np.full(2 * pairings, np.nan)
+        pending = np.arange(pairings)
+        resamples = self.max_resamples if self.boundary_method == 'RESAMPLE' else 0
+        while pending.size:
+            parents1, parents2 = self._get_random_pairs_for_crossing(pending.size)
+            values1, values2 = np.nan, np.nan
+            if self.cross_method == 'ARITHMETIC':
+                children1, children2 = self._arithmetic_cross(parents1, parents2)
+            elif self.cross_method == 'BLEND_ALPHA':
+                children1, children2 = self._blend_cross_alpha(parents1, parents2)
+            elif self.cross_method == 'BLEND_ALPHA_BETA':
+                children1, children2 = self._blend_cross_alpha_beta(parents1, parents2)
+            elif self.cross_method == 'AVERAGE':
+                children1, children2 = self._average_cross(parents1, parents2)
+            elif self.cross_method == 'LINEAR':
+                children1, children2, values1, values2 = self._linear_cross(parents1, parents2)
+            children[pending], children[pending + pairings] = children1, children2
+            children_fitness[pending], children_fitness[pending + pairings] = values1, values2
+            pending = pending[~(in_range(self.context, children1) & in_range(self.context, children2))]
+            if resamples == 0:
+                break
+            resamples -= 1
+            if self.profiler is not None:
+                self.profiler.count('cross_retries', pending.size)
+        invalid = ~in_range(self.context, children)
+        children[invalid] = repair(self.context, children[invalid], self.boundary_method)
+        children_fitness[invalid] = np.nan
+        return children[:amount], children_fitness[:amount]
+
+    def _arithmetic_cross(self, parents1, parents2):
+        k = self.context.rng.random((len(parents1), 1))
+        return k * parents1 + (1 - k) * parents2, k * parents2 + (1 - k) * parents1
+
+    def _blend_cross_alpha(self, parents1, parents2):
+        alpha = self.context.rng.random((len(parents1), 1))
+        return self._blend(parents1, parents2, alpha, alpha)
+
+    def _blend_cross_alpha_beta(self, parents1, parents2):
+        alpha, beta = self.context.rng.random((2, len(parents1), 1))
+        return self._blend(parents1, parents2, alpha, beta)
+
+    def _blend(self, parents1, parents2, alpha, beta):
+        lower, upper = np.minimum(parents1, parents2), np.maximum(parents1, parents2)
+        distance = upper - lower
+        lower, upper = lower - alpha * distance, upper + beta * distance
+        return self.context.rng.uniform(lower, upper, (2,) + lower.shape)
+
+    def _average_cross(self, parents1, parents2):
+        average = (parents1 + parents2) / 2
+        return average, average.copy()
+
+    def _linear_cross(self, parents1, parents2):
+        candidates = np.stack((parents1 / 2 + parents2 / 2,
+                               3 * parents1 / 2 - parents2 / 2,
+                               -parents1 / 2 + 3 * parents2 / 2), axis=1)
+        values = self._evaluate(candidates.reshape(-1, self.dimensions)).reshape(-1, 3)
+        eliminator = np.argmin if self.maximalization else np.argmax
+        kept = np.arange(3) != eliminator(values, axis=1)[:, None]
+        survivors = candidates[kept].reshape(-1, 2, self.dimensions)
+        survivors_values = values[kept].reshape(-1, 2)
+        return survivors[:, 0], survivors[:, 1], survivors_values[:, 0], survivors_values[:, 1]
+
+    def _get_probabilities(self):
+        values = self.fitness if self.maximalization else 1 / self.fitness
+        return values / values.sum()
+
+    def _get_distribuants(self):
+        distribuants = np.cumsum(self._get_probabilities())
+        return distribuants / distribuants[-1]
 
     def _best_selection(self):
-        sorted_results = sorted(self._get_pairs_and_function_values(), key=lambda x: x[1])
-        sorted_population = [x[0] for x in sorted_results]
-        if self.maximalization:
-            return sorted_population[
-                   self.population_size - self.population_size * self.selection_percent // 100:]
-        else:
-            return sorted_population[:self.population_size * self.selection_percent // 100]
-
-    def _fit_in_interval(self, pairs_and_distribuants, value):
-        previous = pairs_and_distribuants[0][0]
-        for chromosome_pair, distribuant in pairs_and_distribuants:
-            if value > distribuant:
-                previous = chromosome_pair
-            else:
-                break
-        return previous
+        return self._get_best_indexes(self.selection_amount, ordered=False)
 
     def _roulette_selection(self):
-        new_population = []
-        rand_numbers = np.random.rand(self.selection_percent * self.population_size // 100)
-        pairs_and_distribuants = self._get_pairs_and_distribuants()
-        for i in range(self.selection_percent * self.population_size // 100):
-            new_population.append(self._fit_in_interval(pairs_and_distribuants, rand_numbers[i]))
-        return new_population
+        rand_numbers = self.context.rng.random(self.selection_amount)
+        indexes = np.searchsorted(self._get_distribuants(), rand_numbers, side='right')
+        return np.minimum(indexes, self.population_size - 1)
+
+    def _stochastic_universal_sampling(self):
+        pointers_before = np.ceil(self._get_distribuants() * self.selection_amount - self.context.rng.random())
+        counts = np.diff(pointers_before, prepend=0).astype(int)
+        return np.repeat(np.arange(self.population_size), counts)
 
     def _tournament_selection(self):
-        tournament_number = self.population_size // (100 // self.selection_percent)
-        tournament_size = self.population_size // tournament_number
-        pairs_and_values = self._get_pairs_and_function_values()
-        random.shuffle(pairs_and_values)
-        winners = []
-        for i in range(tournament_number):
-            if self.maximalization:
-                winners.append(
-                    max(pairs_and_values[i * tournament_size: (i + 1) * tournament_size], key=lambda x: x[1]))
-            else:
-                winners.append(
-                    min(pairs_and_values[i * tournament_size: (i + 1) * tournament_size], key=lambda x: x[1]))
-        return [winner[0] for winner in winners]
+        return self._tournament_winners(self.selection_amount)
+
+    def _tournament_size(self):
+        return self.tournament_size or max(2, 100 // max(self.selection_percent, 1))
+
+    def _tournament_winners(self, amount):
+        contestants = self.context.rng.integers(0, self.population_size, (amount, self._tournament_size()))
+        selector = np.argmax if self.maximalization else np.argmin
+        winners = selector(self.fitness[contestants], axis=1)
+        return np.take_along_axis(contestants, winners[:, None], axis=1)[:, 0]
+
+    def get_best(self, amount):
+        indexes = self._get_best_indexes(amount)
+        return self.genes[indexes], self.fitness[indexes]
+
+    def replace_worst(self, genes, fitness):
+        indexes = self._get_best_indexes(len(genes), worst=True)
+        self.genes[indexes], self.fitness[indexes] = genes, fitness
+        self._store_best_chromosomes()
 
     def __repr__(self):
         return str([repr(chp) for chp in self.chromosome_pairs])
 
     def __getitem__(self, index):
-        return self.chromosome_pairs[index]
+        return individual(self.genes[index], self.fitness[index], self.context)
 
     def sort(self):
-        self.chromosome_pairs.sort(key=lambda x: x.get_function_value())
+        order = np.argsort(self.fitness, kind='stable')
         if self.maximalization:
-            self.chromosome_pairs.reverse()
+            order = order[::-1]
+        self.genes, self.fitness = self.genes[order], self.fitness[order]
 
     def trim(self, max_size):
         self.sort()
         old_generation_size = max_size - len(self.next_gen) if max_size - len(self.next_gen) > 0 else 1
-        self.chromosome_pairs = self.chromosome_pairs[:old_generation_size] + self.next_gen[:max_size]
+        self.genes = np.vstack((self.genes[:old_generation_size], self.next_gen[:max_size]))
+        self.fitness = self._evaluate(self.genes)
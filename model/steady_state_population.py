@@ -0,0 +1,122 @@
+import heapq
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+
+from oe.model.population import Population
+
+
+class SteadyStatePopulation(Population):
+    def __init__(self, chromosome_pairs, offspring_amount=2, replacement_method='WORST', **parameters):
+        if offspring_amount < 1:
+            raise ValueError(f'offspring_amount must be at least 1, got {offspring_amount}')
+        self.offspring_amount = offspring_amount
+        self.replacement_method = replacement_method
+        self.pending = {}
+        self.ready = []
+        self.accepted = 0
+        super().__init__(chromosome_pairs, **parameters)
+        self._build_heap()
+
+    def get_parameters(self):
+        return {**super().get_parameters(), 'offspring_amount': self.offspring_amount,
+                'replacement_method': self.replacement_method}
+
+    @property
+    def asynchronous(self):
+        from oe.utils.evaluators import AsyncEvaluator
+        return isinstance(self.context.evaluate, AsyncEvaluator)
+
+    def epoch(self):
+        self.accepted = 0
+        while self.accepted < self.population_size:
+            if self.profiler is None:
+                self.selection()
+                self.cross()
+                self.mutation()
+                self.evaluation()
+                self.replacement()
+            else:
+                self.profiler.profile_epoch(self)
+        self.epoch_number += 1
+        self._notify_observers()
+
+    def selection(self):
+        self.elite = self.genes[self._tournament_winners(2 * self.offspring_amount)]
+
+    def cross(self):
+        amount = self.offspring_amount
+        if self.asynchronous:
+            amount = min(amount, self.context.evaluate.max_in_flight - len(self.pending))
+        self.next_gen, self.next_gen_fitness = self._cross(amount)
+
+    def evaluation(self):
+        if self.asynchronous:
+            self._submit()
+        else:
+            super().evaluation()
+
+    def replacement(self):
+        children = self.ready if self.asynchronous else zip(self.next_gen, self.next_gen_fitness)
+        for child, value in children:
+            self._replace(child, value)
+            self.accepted += 1
+
+    def _replace(self, child, value):
+        if self.replacement_method == 'WORST':
+            index = self._worst_index()
+        elif self.replacement_method == 'TOURNAMENT':
+            index = self._tournament_loser()
+        if not self._is_better(value, self.fitness[index]):
+            return
+        self.genes[index], self.fitness[index] = child, value
+        self._push(index, replace=self.replacement_method == 'WORST')
+        if self._is_better(value, self.best_fitness):
+            self.best_genes, self.best_fitness = child.copy(), float(value)
+
+    def _submit(self):
+        evaluator = self.context.evaluate
+        self.ready = []
+        for child, value in zip(self.next_gen, self.next_gen_fitness):
+            if np.isnan(value):
+                self.context.cache_misses += 1
+                self.pending[evaluator.submit(child)] = child
+            else:
+                self.context.cache_hits += 1
+                self.ready.append((child, value))
+        if len(self.pending) >= evaluator.max_in_flight:
+            done, _ = wait(self.pending, return_when=FIRST_COMPLETED)
+            self.ready += [(self.pending.pop(future), future.result()) for future in done]
+
+    def replace_worst(self, genes, fitness):
+        super().replace_worst(genes, fitness)
+        self._build_heap()
+
+    def _tournament_loser(self):
+        contestants = self.context.rng.integers(0, self.population_size, self._tournament_size())
+        selector = np.argmin if self.maximalization else np.argmax
+        return int(contestants[selector(self.fitness[contestants])])
+
+    def _key(self, index):
+        return float(self.fitness[index]) if self.maximalization else -float(self.fitness[index])
+
+    def _build_heap(self):
+        self.versions = np.zeros(self.population_size, dtype=int)
+        self.heap = [(self._key(index), index, 0) for index in range(self.population_size)]
+        heapq.heapify(self.heap)
+
+    def _worst_index(self):
+        while self.heap[0][2] != self.versions[self.heap[0][1]]:
+            heapq.heappop(self.heap)
+        return self.heap[0][1]
+
+    def _push(self, index, replace=False):
+        self.versions[index] += 1
+        entry = (self._key(index), index, int(self.versions[index]))
+        if replace:
+            heapq.heapreplace(self.heap, entry)
+            return
+        heapq.heappush(self.heap, entry)
+        if len(self.heap) > 2 * self.population_size:
+            self.heap = [entry for entry in self.heap if entry[2] == self.versions[entry[1]]]
+            heapq.heapify(self.heap)
@@ -0,0 +1,46 @@
+import time
+
+
+class StoppingCriteria:
+    def __init__(self, patience=None, target=None, tolerance=0.0, min_std=None, min_diversity=None,
+                 time_budget=None, evaluations_budget=None, maximalization=False):
+        self.patience = patience
+        self.target = target
+        self.tolerance = tolerance
+        self.min_std = min_std
+        self.min_diversity = min_diversity
+        self.time_budget = time_budget
+        self.evaluations_budget = evaluations_budget
+        self.maximalization = maximalization
+        self.reset()
+
+    def reset(self):
+        self.start_time = time.time()
+        self.best = None
+        self.epochs_without_improvement = 0
+
+    def __call__(self, statistics):
+        if self.best is None or self._is_better(statistics['best'], self.best):
+            self.best = statistics['best']
+            self.epochs_without_improvement = 0
+        else:
+            self.epochs_without_improvement += 1
+        if self.target is not None and self._reached_target(statistics['best']):
+            return 'TARGET'
+        if self.patience is not None and self.epochs_without_improvement >= self.patience:
+            return 'NO_IMPROVEMENT'
+        if self.min_std is not None and statistics['std'] < self.min_std:
+            return 'STD'
+        if self.min_diversity is not None and statistics['diversity'] < self.min_diversity:
+            return 'DIVERSITY'
+        if self.time_budget is not None and time.time() - self.start_time >= self.time_budget:
+            return 'TIME'
+        if self.evaluations_budget is not None and statistics['evaluations'] >= self.evaluations_budget:
+            return 'EVALUATIONS'
+        return None
+
+    def _is_better(self, value, other):
+        return value > other if self.maximalization else value < other
+
+    def _reached_target(self, value):
+        return value >= self.target - self.tolerance if self.maximalization else value <= self.target + self.tolerance
@@ -0,0 +1,75 @@
+import argparse
+import itertools
+import json
+import sys
+
+from oe.data import CROSS, MUTATION, SELECTIONS, RunContext
+from oe.model.population import Population
+from oe.tests import test_config
+from oe.utils.generator import Generator
+from oe.utils.profiler import Profiler
+
+
+def benchmark(selection_method, cross_method, mutation_method, population_amount, epochs=5,
+              begin_range=-2, end_range=2, seed=0):
+    context = RunContext(begin_range=begin_range, end_range=end_range, population_amount=population_amount,
+                         seed=seed)
+    parameters = dict(test_config.default, selection_method=selection_method, cross_method=cross_method,
+                      mutation_method=mutation_method)
+    population = Population(Generator(population_amount, begin_range, end_range, context).get_genes(),
+                            context=context, **parameters)
+    population.epoch()
+    population.profiler = Profiler()
+    for i in range(epochs):
+        population.epoch()
+    profile = population.profiler.summary()
+    total = sum(profile['times'].values())
+    return {'epochs_per_second': epochs / total,
+            'evaluations_per_second': profile['counters']['evaluated_rows'] / total,
+            'stages': {stage: duration / epochs for stage, duration in profile['times'].items()}}
+
+
+def run_benchmarks(sizes, epochs):
+    results = {}
+    for population_amount, selection_method, cross_method, mutation_method in itertools.product(
+            sizes, SELECTIONS, CROSS, MUTATION):
+        key = f'{selection_method}/{cross_method}/{mutation_method}/{population_amount}'
+        results[key] = benchmark(selection_method, cross_method, mutation_method, population_amount, epochs)
+        print(f'{key}: {results[key]["epochs_per_second"]:.2f} epochs/s, '
+              f'{results[key]["evaluations_per_second"]:.0f} evaluations/s')
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        ratio = result['epochs_per_second'] / baseline[key]['epochs_per_second']
+        if ratio < 1 - tolerance:
+            regressions.append(key)
+            print(f'REGRESSION {key}: {ratio:.2f}x of baseline')
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Benchmark all selection, cross and mutation combinations.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10_000, 1_000_000])
+    parser.add_argument('--epochs', type=int, default=5)
+    parser.add_argument('--save', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', help='JSON baseline to compare the results against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown')
+    parsed = parser.parse_args(arguments)
+    results = run_benchmarks(parsed.sizes, parsed.epochs)
+    if parsed.save:
+        with open(parsed.save, 'w') as file:
+            json.dump(results, file, indent=2)
+    if parsed.compare:
+        with open(parsed.compare) as file:
+            baseline = json.load(file)
+        if compare(results, baseline, parsed.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from oe.data import CROSS, MUTATION, SELECTIONS, goldstein_prize
+from oe.tests import test_config
+from oe.tests.test import execute_seeded_genetic_algorithm
+
+SPACE = {'selection_method': SELECTIONS,
+         'cross_method': CROSS,
+         'mutation_method': MUTATION,
+         'mutation_probability': (0.1, 0.9),
+         'selection_percent': (10, 90),
+         'population_amount': [40, 100, 400]}
+
+
+class ResultCache:
+    def __init__(self, path=None):
+        self.path = path
+        self.results = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                self.results = json.load(file)
+
+    @staticmethod
+    def key(config, seed, objective):
+        return json.dumps([config, seed, objective], sort_keys=True)
+
+    def get(self, config, seed, objective):
+        return self.results.get(self.key(config, seed, objective))
+
+    def put(self, config, seed, objective, result):
+        self.results[self.key(config, seed, objective)] = result
+
+    def save(self):
+        if self.path is None:
+            return
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump(self.results, file)
+        os.replace(temporary_path, self.path)
+
+
+def grid(space, points=3):
+    values = []
+    for domain in space.values():
+        if isinstance(domain, tuple):
+            low, high = domain
+            domain = np.linspace(low, high, points)
+            domain = [int(round(value)) for value in domain] if isinstance(low, int) else domain.tolist()
+        values.append(domain)
+    return [dict(zip(space, combination)) for combination in itertools.product(*values)]
+
+
+def random_search(space, amount, seed=None):
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(amount):
+        config = {}
+        for key, domain in space.items():
+            if isinstance(domain, tuple):
+                low, high = domain
+                config[key] = int(rng.integers(low, high + 1)) if isinstance(low, int) else \
+                    float(rng.uniform(low, high))
+            else:
+                config[key] = domain[rng.integers(len(domain))]
+        configs.append(config)
+    return configs
+
+
+def run_config(config, seed, function=goldstein_prize, begin_range=-10, end_range=10):
+    parameters = dict(test_config.default, **config)
+    population_amount = parameters.pop('population_amount', 100)
+    epochs = parameters.pop('epochs')
+    return execute_seeded_genetic_algorithm(seed, begin_range, end_range, population_amount, epochs,
+                                            parameters, function)[0]
+
+
+def evaluate_configs(configs, seeds, cache, function=goldstein_prize, begin_range=-10, end_range=10,
+                     workers=None):
+    objective = [function.__name__, begin_range, end_range]
+    pending = [(config, seed) for config in configs for seed in seeds if cache.get(config, seed, objective) is None]
+    if pending:
+        arguments = (*zip(*pending), repeat(function), repeat(begin_range), repeat(end_range))
+        if workers == 1:
+            results = list(map(run_config, *arguments))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(run_config, *arguments))
+        for (config, seed), result in zip(pending, results):
+            cache.put(config, seed, objective, float(result))
+        cache.save()
+    return [float(np.mean([cache.get(config, seed, objective) for seed in seeds])) for config in configs]
+
+
+def successive_halving(configs, min_epochs, max_epochs, eta=3, seeds=(0,), cache=None, maximalization=False,
+                       **options):
+    cache = cache if cache is not None else ResultCache()
+    configs = [dict(config, maximalization=maximalization) for config in configs]
+    epochs = min_epochs
+    while True:
+        scores = evaluate_configs([dict(config, epochs=epochs) for config in configs], seeds, cache, **options)
+        order = np.argsort(scores)[::-1] if maximalization else np.argsort(scores)
+        ranked = [(configs[i], scores[i]) for i in order]
+        print(f'{epochs} epochs: {len(configs)} configs, best {ranked[0][1]}')
+        if epochs >= max_epochs:
+            return ranked
+        configs = [config for config, _ in ranked[:max(1, len(configs) // eta)]]
+        epochs = min(epochs * eta, max_epochs)
+
+
+def hyperband(space, max_epochs, eta=3, seeds=(0,), cache=None, maximalization=False, seed=None, **options):
+    cache = cache if cache is not None else ResultCache()
+    brackets = int(math.log(max_epochs, eta) + 1e-9)
+    seed_sequence = np.random.SeedSequence(seed)
+    finalists = []
+    for bracket, child in zip(range(brackets, -1, -1), seed_sequence.spawn(brackets + 1)):
+        amount = math.ceil((brackets + 1) / (bracket + 1) * eta ** bracket)
+        configs = random_search(space, amount, child)
+        min_epochs = max(1, round(max_epochs / eta ** bracket))
+        finalists += successive_halving(configs, min_epochs, max_epochs, eta, seeds, cache, maximalization,
+                                        **options)[:1]
+    return sorted(finalists, key=lambda finalist: finalist[1], reverse=maximalization)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Search the parameter space with successive halving.')
+    parser.add_argument('--search', choices=['GRID', 'RANDOM', 'HYPERBAND'], default='HYPERBAND')
+    parser.add_argument('--space', help='JSON file with the search space, lists are choices and '
+                                        'two-element lists are ranges')
+    parser.add_argument('--samples', type=int, default=27, help='configs drawn by the random search')
+    parser.add_argument('--points', type=int, default=3, help='grid points per range')
+    parser.add_argument('--min-epochs', dest='min_epochs', type=int, default=5)
+    parser.add_argument('--max-epochs', dest='max_epochs', type=int, default=70)
+    parser.add_argument('--eta', type=int, default=3, help='fraction of configs kept is 1/eta')
+    parser.add_argument('--seeds', type=int, default=5, help='runs per config')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache', default=os.path.join(tempfile.gettempdir(), 'oe_sweep_cache.json'),
+                        help='JSON file with the finished runs')
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--top', type=int, default=5)
+    parsed = parser.parse_args(arguments)
+    space = SPACE
+    if parsed.space:
+        with open(parsed.space) as file:
+            space = {key: tuple(domain) if len(domain) == 2 and all(isinstance(value, (int, float))
+                                                                    for value in domain) else domain
+                     for key, domain in json.load(file).items()}
+    cache = ResultCache(parsed.cache)
+    seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(parsed.seed).spawn(parsed.seeds)]
+    if parsed.search == 'HYPERBAND':
+        ranked = hyperband(space, parsed.max_epochs, parsed.eta, seeds, cache, seed=parsed.seed,
+                           workers=parsed.workers)
+    else:
+        configs = grid(space, parsed.points) if parsed.search == 'GRID' else \
+            random_search(space, parsed.samples, parsed.seed)
+        ranked = successive_halving(configs, parsed.min_epochs, parsed.max_epochs, parsed.eta, seeds, cache,
+                                    workers=parsed.workers)
+    for config, score in ranked[:parsed.top]:
+        print(f'{score}: {config}')
+    return ranked
+
+
+if __name__ == '__main__':
+    main()
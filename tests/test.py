@@ -1,30 +1,70 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 import numpy as np
 
-from oe.data import GlobalData
+from oe.data import FUNCTIONS, RunContext, goldstein_prize
 from oe.model.population import Population
+from oe.model.stopping import StoppingCriteria
 from oe.tests import test_config
 from oe.utils.generator import Generator
+from oe.utils.observers import EvaluationsToTarget
 
 
 def execute_genetic_algorithm(begin_range=-10, end_range=10, population_amount=100,
-                              epochs=20, **parameters):
-    population_generator = Generator(population_amount, begin_range, end_range)
-    chromosome_pairs = population_generator.get_population()
-    population = Population(chromosome_pairs, **parameters)
-    for i in range(epochs):
-        population.epoch()
-    return population.best.get_function_value()
+                              epochs=20, dimensions=2, stopping=None, context=None, target=None, epsilon=1e-4,
+                              **parameters):
+    population_generator = Generator(population_amount, begin_range, end_range, context)
+    genes = population_generator.get_genes(dimensions)
+    population = Population(genes, context=context, **parameters)
+    evaluations_to_target = EvaluationsToTarget(target, epsilon)
+    if target is not None:
+        population.add_observer(evaluations_to_target)
+    stopping_criteria = None
+    if stopping is not None:
+        stopping_criteria = StoppingCriteria(maximalization=parameters.get('maximalization', False), **stopping)
+    reason = population.evolve(epochs, stopping_criteria)
+    return population.best.get_function_value(), reason, population.epoch_number, evaluations_to_target.evaluations
+
+
+def execute_seeded_genetic_algorithm(seed, begin_range, end_range, population_amount, epochs, parameters,
+                                     function=goldstein_prize):
+    context = RunContext(begin_range=begin_range, end_range=end_range, population_amount=population_amount,
+                         function=function, seed=seed)
+    return execute_genetic_algorithm(begin_range=begin_range, end_range=end_range,
+                                     population_amount=population_amount, epochs=epochs, context=context,
+                                     **parameters)
 
 
 def make_test(comment='', begin_range=-10, end_range=10, population_amount=100,
-              test_number=20, epochs=70, **parameters):
+              test_number=20, epochs=70, seed=None, workers=None, function=goldstein_prize, benchmark=None,
+              **parameters):
     print(f'  {comment}')
-    GlobalData.set(begin_range=begin_range, end_range=end_range, population_amount=population_amount)
-    results = []
-    for i in range(test_number):
-        results.append(execute_genetic_algorithm(begin_range=begin_range, end_range=end_range,
-                                                 population_amount=population_amount, epochs=epochs, **parameters))
-    print(f'    Srednia: {np.mean(results)}, Mediana: {np.median(results)}\n')
+    if benchmark is not None:
+        begin_range, end_range = FUNCTIONS[benchmark].begin_range, FUNCTIONS[benchmark].end_range
+        function = FUNCTIONS[benchmark].function
+        parameters = {'dimensions': FUNCTIONS[benchmark].dimensions, 'target': FUNCTIONS[benchmark].optimum,
+                      **parameters}
+    seed_sequence = np.random.SeedSequence(seed)
+    seeds = [int(child.generate_state(1)[0]) for child in seed_sequence.spawn(test_number)]
+    arguments = (seeds, repeat(begin_range), repeat(end_range), repeat(population_amount), repeat(epochs),
+                 repeat(parameters), repeat(function))
+    if workers == 1:
+        results = list(map(execute_seeded_genetic_algorithm, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(execute_seeded_genetic_algorithm, *arguments))
+    values = [result[0] for result in results]
+    print(f'    Srednia: {np.mean(values)}, Mediana: {np.median(values)}, Ziarno: {seed_sequence.entropy}')
+    print(f'    Srednia liczba epok: {np.mean([result[2] for result in results])}, '
+          f'Powody zatrzymania: {dict(Counter(result[1] for result in results))}')
+    reached = [result[3] for result in results if result[3] is not None]
+    if parameters.get('target') is not None:
+        print(f'    Osiagniecie celu: {len(reached)}/{test_number}, '
+              f'srednia liczba ewaluacji: {np.mean(reached) if reached else None}')
+    print()
+    return np.mean(values), np.median(values)
 
 
 if __name__ == '__main__':
@@ -60,3 +100,6 @@ if __name__ == '__main__':
     make_test(comment='Liczba osobnikow: 400', population_amount=400, **test_config.default)
     make_test(comment='Liczba osobnikow: 40', population_amount=40, **test_config.default)
 
+    print('Porównanie funkcji testowych:')
+    for name in FUNCTIONS:
+        make_test(comment=f'Funkcja {name}', benchmark=name, epsilon=1e-2, **test_config.default)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from oe.data import RunContext, rastrigin
+from oe.model.population import Population
+
+
+def save(path):
+    context = RunContext(-5.12, 5.12, 30, function=rastrigin, seed=0)
+    population = Population(context.rng.uniform(-5.12, 5.12, (30, 3)), mutation_method='GAUSS',
+                            cross_method='ARITHMETIC', context=context)
+    population.evolve(5)
+    population.save_checkpoint(path)
+    return population
+
+
+def test_load_without_context(tmp_path):
+    path = str(tmp_path / 'checkpoint.npz')
+    population = save(path)
+    population.evolve(5)
+    resumed = Population.load_checkpoint(path)
+    assert resumed.context.function is rastrigin
+    assert resumed.context.begin_range == -5.12 and resumed.context.end_range == 5.12
+    resumed.evolve(5)
+    assert np.array_equal(resumed.genes, population.genes)
+
+
+def test_load_with_mismatched_context(tmp_path):
+    path = str(tmp_path / 'checkpoint.npz')
+    save(path)
+    with pytest.raises(ValueError):
+        Population.load_checkpoint(path, RunContext(-5, 5, 30, function=rastrigin))
+    with pytest.raises(ValueError):
+        Population.load_checkpoint(path, RunContext(-5.12, 5.12, 30))
@@ -0,0 +1,12 @@
+from oe.data import RunContext
+from oe.model.genome import individual
+
+
+def test_mutation_with_per_dimension_bounds():
+    context = RunContext([-1, 10], [1, 20], 10, seed=0)
+    for mutation in ('uniform_mutation', 'gauss_mutation'):
+        pair = individual([0.5, 15.0], context=context)
+        for _ in range(50):
+            getattr(pair, mutation)()
+            assert -1 <= pair[0].value <= 1
+            assert 10 <= pair[1].value <= 20
@@ -0,0 +1,18 @@
+import numpy as np
+
+from oe.model.islands import Islands
+
+
+def test_full_topology_runs_are_reproducible():
+    def make_islands():
+        parameters = [{'mutation_method': 'GAUSS', 'cross_method': 'ARITHMETIC', 'selection_method': 'BEST'}] * 3
+        return Islands(parameters, -2, 2, 30, migration_interval=2, migrants_amount=2, topology='FULL', seed=7)
+
+    islands = make_islands()
+    islands.run(10)
+    first = np.array(islands.results)
+    islands.run(10)
+    other = make_islands()
+    other.run(10)
+    assert np.array_equal(first, np.array(islands.results))
+    assert np.array_equal(first, np.array(other.results))
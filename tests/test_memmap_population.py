@@ -0,0 +1,30 @@
+import gc
+import os
+
+import numpy as np
+
+from oe.data import RunContext
+from oe.model.memmap_population import MemmapPopulation
+
+
+def make_population(context):
+    return MemmapPopulation(context.rng.uniform(-2, 2, (100, 2)), chunk_size=16, mutation_method='GAUSS',
+                            cross_method='ARITHMETIC', selection_method='BEST', context=context)
+
+
+def test_context_manager_removes_directory():
+    context = RunContext(-2, 2, 100, seed=0)
+    with make_population(context) as population:
+        population.evolve(3)
+        directory = population.directory
+        assert os.path.isdir(directory)
+        assert np.isfinite(population.best_fitness)
+    assert not os.path.exists(directory)
+
+
+def test_unclosed_population_is_cleaned_up():
+    population = make_population(RunContext(-2, 2, 100, seed=0))
+    directory = population.directory
+    del population
+    gc.collect()
+    assert not os.path.exists(directory)
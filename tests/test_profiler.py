@@ -0,0 +1,35 @@
+import csv
+
+from oe.data import RunContext
+from oe.model.population import Population
+from oe.model.stopping import StoppingCriteria
+from oe.utils.observers import CsvSink
+from oe.utils.profiler import Profiler
+
+
+def make_population(**parameters):
+    context = RunContext(-2, 2, 100, seed=0)
+    return Population(context.rng.uniform(-2, 2, (100, 2)), mutation_method='GAUSS', cross_method='ARITHMETIC',
+                      context=context, **parameters)
+
+
+def test_statistics_keep_total_evaluations():
+    population = make_population(profiler=Profiler())
+    assert population.evolve(50, StoppingCriteria(evaluations_budget=1000)) == 'EVALUATIONS'
+    statistics = population.statistics()
+    assert statistics['evaluations'] == population.context.evaluate.evaluations
+    assert statistics['evaluated_rows'] < statistics['evaluations']
+
+
+def test_csv_sink_with_profiler_attached_later(tmp_path):
+    path = str(tmp_path / 'statistics.csv')
+    sink = CsvSink(path)
+    population = make_population()
+    population.add_observer(sink)
+    population.evolve(2)
+    population.profiler = Profiler()
+    population.evolve(2)
+    sink.close()
+    with open(path, newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert [int(row['epoch']) for row in rows] == [1, 2, 3, 4]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from oe.cli import parse_arguments
+from oe.data import RunContext, goldstein_prize
+from oe.model.steady_state_population import SteadyStatePopulation
+from oe.utils.evaluators import AsyncEvaluator, StandInEvaluator
+from oe.utils.profiler import Profiler
+
+
+def make_population(context, **parameters):
+    genes = context.rng.uniform(-2, 2, (40, 2))
+    return SteadyStatePopulation(genes, mutation_method='GAUSS', cross_method='ARITHMETIC', context=context,
+                                 **parameters)
+
+
+def test_asynchronous_epoch_with_profiler():
+    with AsyncEvaluator(StandInEvaluator(goldstein_prize, latency=0.001), 'THREAD', max_in_flight=4) as evaluator:
+        context = RunContext(-2, 2, 40, seed=1, evaluator=evaluator)
+        population = make_population(context, profiler=Profiler())
+        population.evolve(3)
+    assert population.epoch_number == 3
+    assert population.profiler.counters['evaluated_rows'] == evaluator.evaluations - 40
+    assert np.allclose([goldstein_prize(*genes) for genes in population.genes], population.fitness)
+
+
+def test_resume_with_tied_fitness(tmp_path):
+    def run(epochs, path=None):
+        context = RunContext(-2, 2, 40, seed=3)
+        genes = context.rng.uniform(-2, 2, (40, 2))
+        genes[:20] = genes[0]
+        population = SteadyStatePopulation(genes, mutation_method='GAUSS', cross_method='AVERAGE', context=context)
+        population.evolve(epochs)
+        if path is not None:
+            population.save_checkpoint(path)
+        return population
+
+    uninterrupted = run(20)
+    path = str(tmp_path / 'checkpoint.npz')
+    run(10, path)
+    resumed = SteadyStatePopulation.load_checkpoint(path, RunContext(-2, 2, 40))
+    resumed.evolve(10)
+    assert len(set(uninterrupted.fitness.tolist())) < uninterrupted.population_size
+    assert np.array_equal(resumed.genes, uninterrupted.genes)
+    assert np.array_equal(resumed.fitness, uninterrupted.fitness)
+
+
+def test_rejects_empty_offspring():
+    with pytest.raises(ValueError):
+        make_population(RunContext(-2, 2, 40, seed=0), offspring_amount=0)
+    with pytest.raises(SystemExit):
+        parse_arguments(['--steady-state', '--offspring', '0'])
@@ -0,0 +1,16 @@
+from oe.data import RunContext
+from oe.model.population import Population
+from oe.model.stopping import StoppingCriteria
+
+
+def test_reused_criteria_is_reset():
+    context = RunContext(-2, 2, 20, seed=0)
+    population = Population(context.rng.uniform(-2, 2, (20, 2)), mutation_method='GAUSS',
+                            cross_method='ARITHMETIC', context=context)
+    criteria = StoppingCriteria(patience=1000, time_budget=60)
+    criteria.start_time -= 60
+    criteria.epochs_without_improvement = 1000
+    assert population.evolve(3, criteria) == 'EPOCHS'
+    population.observers.append(lambda statistics: None)
+    assert population.evolve(3, criteria) == 'EPOCHS'
+    assert population.last_statistics['epoch'] == population.epoch_number == 6
@@ -1,49 +1,61 @@
 import numpy as np
 
+MAX_LENGTH = 63
 
-class Singleton:
-    def __init__(self, cls):
-        self.cls = cls
-        self.obj = None
 
-    def __call__(self, *args, **kwargs):
-        if not self.obj:
-            self.obj = self.cls(*args, **kwargs)
-        return self.obj
+def to_gray(words):
+    return words ^ (words >> np.uint64(1))
 
-    def set(self, begin_range, end_range, amount, precision):
-        self.obj = self.cls(begin_range, end_range, amount, precision)
+
+def from_gray(words):
+    words = words.copy()
+    shift = 1
+    while shift < MAX_LENGTH:
+        words ^= words >> np.uint64(shift)
+        shift <<= 1
+    return words
+
+
+def unpack(words, length):
+    shifts = np.arange(length - 1, -1, -1, dtype=np.uint64)
+    bits = (words[..., None] >> shifts) & np.uint64(1)
+    return bits.astype(np.uint8).reshape(*words.shape[:-1], -1)
+
+
+def pack(bits, length):
+    shifts = np.arange(length - 1, -1, -1, dtype=np.uint64)
+    bits = bits.reshape(*bits.shape[:-1], -1, length).astype(np.uint64)
+    return (bits << shifts).sum(axis=-1, dtype=np.uint64)
 
 
-@Singleton
 class Converter:
-    def __init__(self, begin_range, end_range, amount, precision=6):
+    def __init__(self, begin_range, end_range, amount, precision=6, gray=False):
         self.begin_range = begin_range
         self.end_range = end_range
         self.amount = amount
-        self.length = np.ceil(np.log2((end_range - begin_range) * (10 ** precision)))
+        self.gray = gray
+        width = np.max(np.asarray(end_range, dtype=float) - np.asarray(begin_range, dtype=float))
+        self.length = min(int(np.ceil(np.log2(width * (10 ** precision)))), MAX_LENGTH)
+        self.max_word = np.uint64((1 << self.length) - 1)
+
+    def encode(self, genes):
+        scaled = (np.asarray(genes, dtype=float) - self.begin_range) / (self.end_range - self.begin_range)
+        words = np.rint(np.clip(scaled, 0, 1) * float(self.max_word)).astype(np.uint64)
+        words = np.minimum(words, self.max_word)
+        return to_gray(words) if self.gray else words
+
+    def decode(self, words):
+        words = from_gray(words) if self.gray else words
+        return words.astype(float) * (self.end_range - self.begin_range) / float(self.max_word) + self.begin_range
 
     def to_bin(self, num):
-        num = int((num - self.begin_range) * (2**self.length - 1) / (self.end_range - self.begin_range))
-        return self._to_bin(num, self.length)
+        return self._to_bin(self.encode([num]), self.length)
 
     def to_dec(self, bin_representation):
-        num = self._to_dec(bin_representation)
-        return num * (self.end_range - self.begin_range) / (2**self.length - 1) + self.begin_range
-
-    def _to_bin(self, num, m):
-        bin_representation = []
-        while num != 0:
-            bit = int(num % 2)
-            bin_representation.append(bit)
-            num = num // 2
-        bin_representation.reverse()
-        while len(bin_representation) != m:
-            bin_representation.insert(0, 0)
-        return bin_representation
-
-    def _to_dec(self, bin_representation):
-        dec = 0
-        for bit in bin_representation[1:]:
-            dec = (dec << 1) | bit
-        return dec
+        return float(self.decode(self._to_dec(bin_representation, self.length))[0])
+
+    def _to_bin(self, words, m):
+        return [int(bit) for bit in unpack(words, m)]
+
+    def _to_dec(self, bin_representation, m):
+        return pack(np.asarray(bin_representation, dtype=np.uint8), m)
@@ -0,0 +1,47 @@
+import numpy as np
+
+ERF_P = 0.3275911
+ERF_A = (0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429)
+
+PPF_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+PPF_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01, 1.0)
+PPF_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+PPF_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+         3.754408661907416e+00, 1.0)
+PPF_LOW = 0.02425
+
+
+def erf(x):
+    # Abramowitz & Stegun 7.1.26, absolute error below 1.5e-7
+    sign, x = np.sign(x), np.abs(x)
+    t = 1 / (1 + ERF_P * x)
+    return sign * (1 - np.polyval(ERF_A[::-1], t) * t * np.exp(-x * x))
+
+
+def normal_cdf(x):
+    return (1 + erf(np.asarray(x) / np.sqrt(2))) / 2
+
+
+def normal_ppf(p):
+    # Acklam's rational approximation, relative error below 1.2e-9
+    p = np.clip(np.asarray(p, dtype=float), np.finfo(float).tiny, 1 - np.finfo(float).eps)
+    x = np.empty_like(p)
+    low, high = p < PPF_LOW, p > 1 - PPF_LOW
+    central = ~(low | high)
+    q = p[central] - 0.5
+    r = q * q
+    x[central] = np.polyval(PPF_A, r) * q / np.polyval(PPF_B, r)
+    q = np.sqrt(-2 * np.log(p[low]))
+    x[low] = np.polyval(PPF_C, q) / np.polyval(PPF_D, q)
+    q = np.sqrt(-2 * np.log(1 - p[high]))
+    x[high] = -np.polyval(PPF_C, q) / np.polyval(PPF_D, q)
+    return x
+
+
+def truncated_normal(lower, upper, rng):
+    lower_cdf, upper_cdf = normal_cdf(lower), normal_cdf(upper)
+    samples = normal_ppf(lower_cdf + rng.random(np.shape(lower_cdf)) * (upper_cdf - lower_cdf))
+    return np.clip(samples, lower, upper)
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import numpy as np
+
+
+def evaluate_one(function, genes):
+    if getattr(function, 'takes_matrix', False):
+        return float(np.asarray(function(genes[None]), dtype=float).reshape(-1)[0])
+    return float(function(*genes))
+
+
+class StandInEvaluator:
+    def __init__(self, function, latency=0.01, jitter=0.0, seed=None):
+        self.function = function
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self.rng = None
+
+    def delay(self):
+        if self.rng is None:
+            self.rng = np.random.default_rng(self.seed)
+        return self.latency + self.jitter * self.rng.random()
+
+    def __call__(self, *genes):
+        time.sleep(self.delay())
+        return evaluate_one(self.function, np.asarray(genes, dtype=float))
+
+    async def coroutine(self, *genes):
+        await asyncio.sleep(self.delay())
+        return evaluate_one(self.function, np.asarray(genes, dtype=float))
+
+
+class AsyncEvaluator:
+    def __init__(self, function, backend='THREAD', max_in_flight=8):
+        self.function = function
+        self.backend = backend
+        self.max_in_flight = max_in_flight
+        self.slots = threading.BoundedSemaphore(max_in_flight)
+        self.evaluations = 0
+        self.calls = 0
+        self.loop = None
+        if backend == 'THREAD':
+            self.executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        elif backend == 'PROCESS':
+            self.executor = ProcessPoolExecutor(max_workers=max_in_flight)
+        elif backend == 'ASYNCIO':
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        else:
+            raise ValueError(f'Unknown evaluator backend: {backend}')
+
+    def submit(self, genes):
+        genes = np.asarray(genes, dtype=float)
+        self.slots.acquire()
+        self.evaluations += 1
+        if self.loop is not None:
+            future = asyncio.run_coroutine_threadsafe(self.function(*genes), self.loop)
+        else:
+            future = self.executor.submit(evaluate_one, self.function, genes)
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    def __call__(self, genes):
+        genes = np.atleast_2d(np.asarray(genes, dtype=float))
+        self.calls += 1
+        values = np.empty(len(genes))
+        pending = {}
+        for index, row in enumerate(genes):
+            if len(pending) == self.max_in_flight:
+                self._collect(pending, values)
+            pending[self.submit(row)] = index
+        while pending:
+            self._collect(pending, values)
+        return values
+
+    @staticmethod
+    def _collect(pending, values):
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            values[pending.pop(future)] = future.result()
+
+    def close(self):
+        if self.loop is not None:
+            asyncio.run_coroutine_threadsafe(self._cancel_tasks(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        else:
+            self.executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    async def _cancel_tasks():
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
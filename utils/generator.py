@@ -1,24 +1,39 @@
-import random
+import numpy as np
 
+from oe.data import GlobalData
 from oe.model.chromosome import Chromosome
 from oe.model.chromosome_pair import ChromosomePair
 
 
 class Generator:
-    def __init__(self, amount, x1, x2):
+    def __init__(self, amount, x1, x2, context=None):
         self.amount = amount
         self.x1 = x1
         self.x2 = x2
+        self._context = context
 
-    @staticmethod
-    def get_random_tuple(x1, x2):
-        return random.uniform(x1, x2), random.uniform(x1, x2)
+    @property
+    def context(self):
+        return self._context if self._context is not None else GlobalData()
+
+    def get_random_tuple(self, x1, x2):
+        return tuple(float(value) for value in self.context.rng.uniform(x1, x2, 2))
 
     def get_population(self):
         population = []
         for item in range(self.amount):
             ch1, ch2 = self.get_random_tuple(self.x1, self.x2)
-            population.append(ChromosomePair(Chromosome(ch1),
-                                             Chromosome(ch2)))
+            population.append(ChromosomePair(Chromosome(ch1, self._context, 0),
+                                             Chromosome(ch2, self._context, 1), context=self._context))
+
+        return population
+
+    def get_genes(self, dimensions=2):
+        return self.context.rng.uniform(self.x1, self.x2, (self.amount, dimensions))
 
-        return population
\ No newline at end of file
+    def get_genes_memmap(self, path, dimensions=2, chunk_size=65536):
+        genes = np.memmap(path, dtype=float, mode='w+', shape=(self.amount, dimensions))
+        for start in range(0, self.amount, chunk_size):
+            stop = min(start + chunk_size, self.amount)
+            genes[start:stop] = self.context.rng.uniform(self.x1, self.x2, (stop - start, dimensions))
+        return genes
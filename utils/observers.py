@@ -0,0 +1,65 @@
+import csv
+import json
+
+
+class CsvSink:
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='')
+        self.writer = None
+
+    def __call__(self, statistics):
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, fieldnames=list(statistics), extrasaction='ignore')
+            self.writer.writeheader()
+        self.writer.writerow(statistics)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class NdjsonSink:
+    def __init__(self, path):
+        self.file = open(path, 'w')
+
+    def __call__(self, statistics):
+        self.file.write(json.dumps(statistics) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class History:
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, statistics):
+        self.records.append(statistics)
+
+    def __getitem__(self, key):
+        return [record[key] for record in self.records]
+
+
+class EvaluationsToTarget:
+    def __init__(self, target, epsilon=1e-4):
+        self.target = target
+        self.epsilon = epsilon
+        self.evaluations = None
+        self.epoch = None
+
+    def __call__(self, statistics):
+        if self.evaluations is None and abs(statistics['best'] - self.target) <= self.epsilon:
+            self.evaluations = statistics['evaluations']
+            self.epoch = statistics['epoch']
+
+
+class Checkpoint:
+    def __init__(self, population, path, interval=100):
+        self.population = population
+        self.path = path
+        self.interval = interval
+
+    def __call__(self, statistics):
+        if statistics['epoch'] % self.interval == 0:
+            self.population.save_checkpoint(self.path)
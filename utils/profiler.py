@@ -0,0 +1,57 @@
+import time
+import tracemalloc
+
+
+PHASES = ['selection', 'cross', 'mutation', 'evaluation', 'replacement']
+COUNTERS = ['evaluation_calls', 'evaluated_rows', 'cross_retries', 'gauss_redraws']
+
+
+class Profiler:
+    def __init__(self, track_allocations=False):
+        self.track_allocations = track_allocations
+        self.epochs = 0
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.allocations = dict.fromkeys(PHASES, 0)
+        self.last_epoch = dict.fromkeys(COUNTERS, 0)
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def count(self, counter, amount=1):
+        self.last_epoch[counter] += int(amount)
+
+    def profile_epoch(self, population):
+        self.last_epoch = dict.fromkeys(COUNTERS, 0)
+        evaluate = population.context.evaluate
+        calls, evaluations = evaluate.calls, evaluate.evaluations
+        for phase in PHASES:
+            if self.track_allocations:
+                tracemalloc.reset_peak()
+                allocated_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            getattr(population, phase)()
+            self.last_epoch['time_' + phase] = time.perf_counter() - start
+            if self.track_allocations:
+                self.last_epoch['allocated_' + phase] = tracemalloc.get_traced_memory()[1] - allocated_before
+        self.last_epoch['evaluation_calls'] = evaluate.calls - calls
+        self.last_epoch['evaluated_rows'] = evaluate.evaluations - evaluations
+        self.epochs += 1
+        for phase in PHASES:
+            self.times[phase] += self.last_epoch['time_' + phase]
+            if self.track_allocations:
+                self.allocations[phase] = max(self.allocations[phase], self.last_epoch['allocated_' + phase])
+        for counter in COUNTERS:
+            self.counters[counter] += self.last_epoch[counter]
+
+    def summary(self):
+        return {'epochs': self.epochs,
+                'times': dict(self.times),
+                'counters': dict(self.counters),
+                'peak_allocations': dict(self.allocations) if self.track_allocations else None}
+
+    def __repr__(self):
+        total = sum(self.times.values()) or 1
+        lines = [f'{phase:>12}: {duration:9.4f} s ({100 * duration / total:5.1f}%)'
+                 for phase, duration in self.times.items()]
+        lines += [f'{counter:>12}: {value}' for counter, value in self.counters.items()]
+        return '\n'.join(lines)